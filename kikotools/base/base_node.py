@@ -59,6 +59,23 @@ class ComfyAssetsBaseNode:
         """
         logger.info(f"{self.__class__.__name__}: {message}")
 
+    def _log_enabled_info(self) -> bool:
+        """Check whether INFO records would be emitted by the node logger"""
+        return logger.isEnabledFor(logging.INFO)
+
+    def log_info_lazy(self, fmt: str, *args: Any) -> None:
+        """
+        Info logging with deferred %-style formatting
+
+        The message is only formatted if INFO records are actually emitted,
+        so hot paths avoid building strings when logging is disabled.
+
+        Args:
+            fmt: %-style format string
+            *args: Values substituted into fmt
+        """
+        logger.info("%s: " + fmt, self.__class__.__name__, *args)
+
     @classmethod
     def get_node_info(cls) -> Dict[str, Any]:
         """
@@ -6,7 +6,10 @@ from typing import Dict, List
 
 def split_image_batch(images: torch.Tensor) -> List[torch.Tensor]:
     """Split [B,H,W,C] image batch into list of [1,H,W,C] tensors."""
-    return [images[i : i + 1] for i in range(images.shape[0])]
+    if images.shape[0] == 0:
+        return []
+    # torch.split yields [1,H,W,C] views without a Python-level slicing loop
+    return list(torch.split(images, 1))
 
 
 def join_image_batch(image_list: List[torch.Tensor]) -> torch.Tensor:
@@ -25,14 +28,17 @@ def split_latent_batch(
     """
     samples = latent["samples"]
     batch_size = samples.shape[0]
+    # Slice each batched tensor once up front; torch.split yields [1, ...] views
+    pieces = {
+        key: torch.split(value, 1)
+        for key, value in latent.items()
+        if isinstance(value, torch.Tensor) and value.shape[0] == batch_size
+    }
     result: List[Dict[str, torch.Tensor]] = []
     for i in range(batch_size):
         item: Dict[str, torch.Tensor] = {}
         for key, value in latent.items():
-            if isinstance(value, torch.Tensor) and value.shape[0] == batch_size:
-                item[key] = value[i : i + 1]
-            else:
-                item[key] = value
+            item[key] = pieces[key][i] if key in pieces else value
         result.append(item)
     return result
 
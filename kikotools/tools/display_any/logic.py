@@ -2,6 +2,8 @@
 
 from typing import Any, List
 
+_VALID_MODES = frozenset({"raw value", "tensor shape"})
+
 
 def get_tensor_shapes(input_value: Any) -> List[List[int]]:
     """Extract tensor shapes from nested structures.
@@ -69,5 +71,8 @@ def validate_display_mode(mode: str) -> bool:
     Returns:
         True if mode is valid, False otherwise
     """
-    valid_modes = ["raw value", "tensor shape"]
-    return mode in valid_modes
+    try:
+        return mode in _VALID_MODES
+    except TypeError:
+        # Unhashable values can never be a valid mode
+        return False
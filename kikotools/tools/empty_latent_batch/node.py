@@ -11,8 +11,8 @@ from .logic import (
 )
 from ..width_height_selector.logic import get_preset_dimensions
 from ..width_height_selector.presets import (
+    FORMATTED_PRESET_OPTIONS,
     PRESET_OPTIONS,
-    PRESET_METADATA,
 )
 
 
@@ -27,26 +27,10 @@ class EmptyLatentBatchNode(ComfyAssetsBaseNode):
     @classmethod
     def INPUT_TYPES(cls):
         """Define the input types for the ComfyUI node."""
-        # Create formatted preset options with metadata
-        preset_options = ["custom"]  # Custom first
-
-        # Add formatted presets with metadata
-        for preset_name in PRESET_OPTIONS.keys():
-            if preset_name != "custom":
-                metadata = PRESET_METADATA.get(preset_name)
-                if metadata:
-                    formatted_option = (
-                        f"{preset_name} - {metadata.aspect_ratio} "
-                        f"({metadata.megapixels:.1f}MP) - {metadata.model_group}"
-                    )
-                    preset_options.append(formatted_option)
-                else:
-                    preset_options.append(preset_name)
-
         return {
             "required": {
                 "preset": (
-                    preset_options,
+                    FORMATTED_PRESET_OPTIONS,
                     {
                         "default": "custom",
                         "tooltip": "Select from optimized resolution presets or use "
@@ -185,7 +169,7 @@ class EmptyLatentBatchNode(ComfyAssetsBaseNode):
         if " - " in formatted_preset:
             # Format is: "1024×1024 - 1:1 (1.0MP) - SDXL"
             # Extract the first part (resolution)
-            resolution_part = formatted_preset.split(" - ")[0]
+            resolution_part = formatted_preset.partition(" - ")[0]
 
             # Verify this is a valid preset name
             if resolution_part in PRESET_OPTIONS:
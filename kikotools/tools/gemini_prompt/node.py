@@ -105,8 +105,11 @@ Install: pip install google-generativeai
         if not validate_prompt_type(prompt_type):
             raise ValueError(f"Invalid prompt type: {prompt_type}")
 
-        # Convert torch tensor to numpy if needed
+        # Convert torch tensor to numpy if needed. Only the first image of a
+        # batch is analyzed, so copy just that frame to the host
         if isinstance(image, torch.Tensor):
+            if image.ndim == 4:
+                image = image[:1]
             image_np = image.cpu().numpy()
         else:
             image_np = image
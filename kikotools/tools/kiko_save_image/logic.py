@@ -150,14 +150,27 @@ def convert_tensor_to_pil(image_tensor: torch.Tensor) -> Image.Image:
     Returns:
         PIL Image in RGB/RGBA format
     """
-    # Convert tensor (0-1 float) to 0-255 numpy array
-    i = 255.0 * image_tensor.cpu().numpy()
-    img_array = np.clip(i, 0, 255).astype(np.uint8)
-
     # Create PIL image from numpy array
-    img = Image.fromarray(img_array)
+    return Image.fromarray(convert_tensor_to_uint8(image_tensor))
+
+
+def convert_tensor_to_uint8(image_tensor: torch.Tensor) -> np.ndarray:
+    """
+    Convert a ComfyUI image tensor or batch to a 0-255 uint8 numpy array
+
+    A whole batch is moved to the host and converted in one pass, so each
+    image in the result is a view rather than a separate transfer. Scaling
+    and quantization run on the tensor's own device, so only uint8 data is
+    copied to the host.
 
-    return img
+    Args:
+        image_tensor: Tensor in format [..., height, width, channels], values 0-1
+
+    Returns:
+        uint8 numpy array with the same shape as the input
+    """
+    i = image_tensor.mul(255.0).clamp_(0, 255)
+    return i.to(torch.uint8).cpu().numpy()
 
 
 def create_png_metadata(
@@ -306,9 +319,9 @@ def process_image_batch(
     results = []
     enhanced_data = []
 
-    for image_tensor in images:
-        # Convert tensor to PIL Image
-        img = convert_tensor_to_pil(image_tensor)
+    # Convert the whole batch at once; each frame is then a view
+    for img_array in convert_tensor_to_uint8(images):
+        img = Image.fromarray(img_array)
 
         # Get next counter value to ensure unique filenames
         # This counter persists across node calls, preventing overwrites
@@ -37,9 +37,9 @@ def load_image_from_path(path: str) -> Tuple[torch.Tensor, Dict[str, Any]]:
         else:
             img_out = img.convert("RGB")
 
-        # Convert to tensor
-        img_array = np.array(img_out).astype(np.float32) / 255.0
-        image_tensor = torch.from_numpy(img_array)[None,]
+        # Convert to tensor; scale the uint8 pixels in place after a single
+        # float32 allocation instead of building two float intermediates
+        image_tensor = torch.from_numpy(np.array(img_out)).float().div_(255.0)[None,]
 
         # Collect metadata
         metadata = {
@@ -92,7 +92,7 @@ class LocalImageLoaderNode(ComfyAssetsBaseNode):
         Returns:
             Tuple of (image tensor, info string)
         """
-        image_tensor = create_empty_tensor()
+        image_tensor = None
         info_string = ""
 
         selections = load_selections()
@@ -109,6 +109,10 @@ class LocalImageLoaderNode(ComfyAssetsBaseNode):
                 except Exception as e:
                     print(f"KikoLocalImageLoader: Error loading image: {e}")
 
+        # Only build the placeholder when nothing was loaded
+        if image_tensor is None:
+            image_tensor = create_empty_tensor()
+
         return (image_tensor, info_string)
 
 
@@ -3,6 +3,7 @@ Resolution Calculator ComfyUI Node
 Provides ComfyUI interface for calculating upscaled dimensions
 """
 
+import math
 import torch
 from typing import Dict, Any, Tuple, Optional
 
@@ -86,26 +87,30 @@ class ResolutionCalculatorNode(ComfyAssetsBaseNode):
         """
         try:
             # Validate inputs using base class
-            self.validate_inputs(scale_factor=scale_factor, image=image, latent=latent)
-
-            # Log the operation
-            input_type = (
-                "IMAGE"
-                if image is not None
-                else "LATENT" if latent is not None else "NONE"
-            )
-            self.log_info(
-                f"Calculating resolution with scale_factor={scale_factor}, "
-                f"input_type={input_type}"
+            scale_factor = self.validate_inputs(
+                scale_factor=scale_factor, image=image, latent=latent
             )
 
+            # Log the operation, skipping the input type lookup when muted
+            if self._log_enabled_info():
+                input_type = (
+                    "IMAGE"
+                    if image is not None
+                    else "LATENT" if latent is not None else "NONE"
+                )
+                self.log_info_lazy(
+                    "Calculating resolution with scale_factor=%s, input_type=%s",
+                    scale_factor,
+                    input_type,
+                )
+
             # Calculate the resolution
             width, height = calculate_resolution_from_input(
                 scale_factor=scale_factor, image=image, latent=latent
             )
 
             # Log the result
-            self.log_info(f"Calculated resolution: {width}x{height}")
+            self.log_info_lazy("Calculated resolution: %sx%s", width, height)
 
             return width, height
 
@@ -119,7 +124,7 @@ class ResolutionCalculatorNode(ComfyAssetsBaseNode):
         scale_factor: float,
         image: Optional[torch.Tensor] = None,
         latent: Optional[Dict[str, torch.Tensor]] = None,
-    ) -> None:
+    ) -> float:
         """
         Validate inputs specific to resolution calculator
 
@@ -128,6 +133,9 @@ class ResolutionCalculatorNode(ComfyAssetsBaseNode):
             image: Optional image tensor
             latent: Optional latent dict
 
+        Returns:
+            The scale factor converted to float
+
         Raises:
             ValueError: If validation fails
         """
@@ -135,12 +143,21 @@ class ResolutionCalculatorNode(ComfyAssetsBaseNode):
         if image is None and latent is None:
             raise ValueError("Either 'image' or 'latent' input must be provided")
 
-        # Validate scale factor type
-        if not isinstance(scale_factor, (int, float)):
+        # Validate scale factor is numeric. Strings and bools are rejected;
+        # coercing still accepts NumPy scalars and 0-d tensors arriving over
+        # wire connections
+        try:
+            if isinstance(scale_factor, (str, bytes, bool)):
+                raise TypeError
+            scale = float(scale_factor)
+        except (TypeError, ValueError):
             raise ValueError(
                 f"scale_factor must be a number, got {type(scale_factor).__name__}"
             )
 
+        if not math.isfinite(scale):
+            raise ValueError(f"scale_factor must be finite, got {scale}")
+
         # Validate tensors using helper methods
         if image is not None:
             self._validate_image_tensor(image)
@@ -148,6 +165,8 @@ class ResolutionCalculatorNode(ComfyAssetsBaseNode):
         if latent is not None:
             self._validate_latent_dict(latent)
 
+        return scale
+
     def _validate_image_tensor(self, image: torch.Tensor) -> None:
         """Validate image tensor format"""
         if not isinstance(image, torch.Tensor):
@@ -155,10 +174,10 @@ class ResolutionCalculatorNode(ComfyAssetsBaseNode):
                 f"image must be a torch.Tensor, got {type(image).__name__}"
             )
 
-        if len(image.shape) != 4:
+        if image.dim() != 4:
             raise ValueError(
                 f"image tensor must have 4 dimensions "
-                f"[batch, height, width, channels], got {len(image.shape)}"
+                f"[batch, height, width, channels], got {image.dim()}"
             )
 
     def _validate_latent_dict(self, latent: Dict[str, torch.Tensor]) -> None:
@@ -176,10 +195,10 @@ class ResolutionCalculatorNode(ComfyAssetsBaseNode):
                 f"got {type(samples).__name__}"
             )
 
-        if len(samples.shape) != 4:
+        if samples.dim() != 4:
             raise ValueError(
                 f"latent samples tensor must have 4 dimensions "
-                f"[batch, channels, height, width], got {len(samples.shape)}"
+                f"[batch, channels, height, width], got {samples.dim()}"
             )
 
 
@@ -3,6 +3,7 @@
 from typing import Tuple
 from ...base.base_node import ComfyAssetsBaseNode
 from .logic import (
+    _DEFAULT_COMBO,
     get_sampler_combo,
     SAMPLERS,
     SCHEDULERS,
@@ -20,17 +21,18 @@ class SamplerComboCompactNode(ComfyAssetsBaseNode):
     @classmethod
     def INPUT_TYPES(cls):
         """Define compact input types for the ComfyUI node."""
+        # Built per call from ComfyUI's live sampler lists
         return {
             "required": {
                 "sampler": (
-                    SAMPLERS,
+                    list(SAMPLERS),
                     {
                         "default": "euler",
                         "tooltip": "Sampler",
                     },
                 ),
                 "sched": (
-                    SCHEDULERS,
+                    list(SCHEDULERS),
                     {
                         "default": "normal",
                         "tooltip": "Scheduler",
@@ -59,6 +61,7 @@ class SamplerComboCompactNode(ComfyAssetsBaseNode):
             }
         }
 
+    # Same list objects as KSampler's inputs, so the outputs stay connectable
     RETURN_TYPES = (SAMPLERS, SCHEDULERS, "INT", "FLOAT")
     RETURN_NAMES = ("sampler", "scheduler", "steps", "cfg")
     FUNCTION = "get_combo"
@@ -88,7 +91,7 @@ class SamplerComboCompactNode(ComfyAssetsBaseNode):
         except Exception as e:
             # Graceful fallback
             self.handle_error(f"Error in compact combo: {str(e)}")
-            return ("euler", "normal", 20, 7.0)
+            return _DEFAULT_COMBO
 
     def __str__(self) -> str:
         """String representation of the compact node."""
@@ -1,6 +1,7 @@
 """Logic module for Sampler Combo node."""
 
-from typing import Tuple, Dict, Any, List
+from types import MappingProxyType
+from typing import Tuple, Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,11 +10,12 @@ logger = logging.getLogger(__name__)
 try:
     import comfy.samplers
 
+    # Keep the live lists: node packs loaded later add their own entries
     SAMPLERS = comfy.samplers.KSampler.SAMPLERS
     SCHEDULERS = comfy.samplers.KSampler.SCHEDULERS
 except ImportError:
     # Fallback for testing/development environment
-    SAMPLERS = [
+    SAMPLERS = (
         "euler",
         "euler_ancestral",
         "heun",
@@ -28,8 +30,8 @@ except ImportError:
         "ddim",
         "uni_pc",
         "uni_pc_bh2",
-    ]
-    SCHEDULERS = [
+    )
+    SCHEDULERS = (
         "normal",
         "karras",
         "exponential",
@@ -37,7 +39,64 @@ except ImportError:
         "simple",
         "ddim_uniform",
         "beta",
-    ]
+    )
+
+# Safe fallback returned whenever settings are invalid
+_DEFAULT_COMBO = ("euler", "normal", 20, 7.0)
+
+# Scheduler compatibility recommendations
+_COMPAT_MAP = MappingProxyType(
+    {
+        "euler": ("normal", "simple", "sgm_uniform"),
+        "euler_ancestral": ("normal", "karras", "exponential"),
+        "heun": ("normal", "karras"),
+        "dpm_2": ("normal", "karras"),
+        "dpm_2_ancestral": ("normal", "karras", "exponential"),
+        "dpmpp_2s_ancestral": ("normal", "karras", "exponential"),
+        "dpmpp_sde": ("normal", "karras", "exponential"),
+        "dpmpp_2m": ("normal", "karras", "sgm_uniform"),
+        "ddim": ("ddim_uniform", "normal"),
+        "uni_pc": ("normal", "sgm_uniform"),
+        "uni_pc_bh2": ("normal", "sgm_uniform"),
+    }
+)
+_DEFAULT_COMPAT = ("normal", "karras")
+
+# Steps recommendations by sampler: (min_steps, max_steps, default_steps)
+_STEPS_MAP = MappingProxyType(
+    {
+        "euler": (10, 30, 20),
+        "euler_ancestral": (15, 40, 25),
+        "heun": (10, 25, 15),
+        "dpm_2": (10, 30, 22),
+        "dpm_2_ancestral": (15, 35, 25),
+        "dpmpp_2s_ancestral": (15, 40, 28),
+        "dpmpp_sde": (15, 35, 25),
+        "dpmpp_2m": (15, 30, 20),
+        "ddim": (20, 50, 30),
+        "uni_pc": (10, 25, 15),
+        "uni_pc_bh2": (10, 25, 15),
+    }
+)
+_DEFAULT_STEPS = (10, 50, 20)
+
+# CFG recommendations by sampler: (min_cfg, max_cfg, default_cfg)
+_CFG_MAP = MappingProxyType(
+    {
+        "euler": (3.0, 15.0, 7.0),
+        "euler_ancestral": (5.0, 20.0, 8.0),
+        "heun": (3.0, 12.0, 6.0),
+        "dpm_2": (4.0, 15.0, 7.5),
+        "dpm_2_ancestral": (5.0, 18.0, 8.5),
+        "dpmpp_2s_ancestral": (6.0, 20.0, 9.0),
+        "dpmpp_sde": (5.0, 18.0, 8.0),
+        "dpmpp_2m": (4.0, 15.0, 7.0),
+        "ddim": (3.0, 12.0, 6.0),
+        "uni_pc": (3.0, 12.0, 6.5),
+        "uni_pc_bh2": (3.0, 12.0, 6.5),
+    }
+)
+_DEFAULT_CFG = (1.0, 20.0, 7.0)
 
 
 def validate_sampler_settings(
@@ -103,46 +162,54 @@ def get_sampler_combo(
         if not validate_sampler_settings(sampler_name, scheduler, steps, cfg):
             # Return safe defaults if validation fails
             logger.warning("Invalid settings provided, using safe defaults")
-            return ("euler", "normal", 20, 7.0)
-
-        # Sanitize values
-        steps = max(1, min(1000, int(steps)))
-        cfg = max(0.0, min(30.0, float(cfg)))
+            return _DEFAULT_COMBO
 
-        return (sampler_name, scheduler, steps, cfg)
+        return _get_sampler_combo_unchecked(sampler_name, scheduler, steps, cfg)
 
     except Exception as e:
         logger.error(f"Error processing sampler combo: {e}")
         # Return safe defaults on any error
-        return ("euler", "normal", 20, 7.0)
+        return _DEFAULT_COMBO
 
 
-def get_compatible_scheduler_suggestions(sampler_name: str) -> List[str]:
+def _get_sampler_combo_unchecked(
+    sampler_name: str, scheduler: str, steps: int, cfg: float
+) -> Tuple[str, str, int, float]:
     """
-    Get scheduler suggestions that work well with specific samplers.
+    Sanitize sampler combo settings without re-running validation.
+
+    Callers must have already passed the settings through
+    validate_sampler_settings.
 
     Args:
         sampler_name: The sampler algorithm name
+        scheduler: The scheduler algorithm name
+        steps: Number of sampling steps
+        cfg: CFG scale value
 
     Returns:
-        List of recommended scheduler names
+        Tuple of (sampler_name, scheduler, steps, cfg)
     """
-    # Scheduler compatibility recommendations
-    compatibility_map = {
-        "euler": ["normal", "simple", "sgm_uniform"],
-        "euler_ancestral": ["normal", "karras", "exponential"],
-        "heun": ["normal", "karras"],
-        "dpm_2": ["normal", "karras"],
-        "dpm_2_ancestral": ["normal", "karras", "exponential"],
-        "dpmpp_2s_ancestral": ["normal", "karras", "exponential"],
-        "dpmpp_sde": ["normal", "karras", "exponential"],
-        "dpmpp_2m": ["normal", "karras", "sgm_uniform"],
-        "ddim": ["ddim_uniform", "normal"],
-        "uni_pc": ["normal", "sgm_uniform"],
-        "uni_pc_bh2": ["normal", "sgm_uniform"],
-    }
+    # Sanitize values (inline clamps avoid nested min/max calls)
+    steps = int(steps)
+    steps = 1 if steps < 1 else 1000 if steps > 1000 else steps
+    cfg = float(cfg)
+    cfg = 0.0 if cfg < 0.0 else 30.0 if cfg > 30.0 else cfg
 
-    return compatibility_map.get(sampler_name, ["normal", "karras"])
+    return (sampler_name, scheduler, steps, cfg)
+
+
+def get_compatible_scheduler_suggestions(sampler_name: str) -> Tuple[str, ...]:
+    """
+    Get scheduler suggestions that work well with specific samplers.
+
+    Args:
+        sampler_name: The sampler algorithm name
+
+    Returns:
+        Tuple of recommended scheduler names
+    """
+    return _COMPAT_MAP.get(sampler_name, _DEFAULT_COMPAT)
 
 
 def get_recommended_steps_range(sampler_name: str) -> Tuple[int, int, int]:
@@ -155,22 +222,7 @@ def get_recommended_steps_range(sampler_name: str) -> Tuple[int, int, int]:
     Returns:
         Tuple of (min_steps, max_steps, default_steps)
     """
-    # Steps recommendations by sampler
-    steps_map = {
-        "euler": (10, 30, 20),
-        "euler_ancestral": (15, 40, 25),
-        "heun": (10, 25, 15),
-        "dpm_2": (10, 30, 22),
-        "dpm_2_ancestral": (15, 35, 25),
-        "dpmpp_2s_ancestral": (15, 40, 28),
-        "dpmpp_sde": (15, 35, 25),
-        "dpmpp_2m": (15, 30, 20),
-        "ddim": (20, 50, 30),
-        "uni_pc": (10, 25, 15),
-        "uni_pc_bh2": (10, 25, 15),
-    }
-
-    return steps_map.get(sampler_name, (10, 50, 20))
+    return _STEPS_MAP.get(sampler_name, _DEFAULT_STEPS)
 
 
 def get_recommended_cfg_range(sampler_name: str) -> Tuple[float, float, float]:
@@ -183,22 +235,7 @@ def get_recommended_cfg_range(sampler_name: str) -> Tuple[float, float, float]:
     Returns:
         Tuple of (min_cfg, max_cfg, default_cfg)
     """
-    # CFG recommendations by sampler
-    cfg_map = {
-        "euler": (3.0, 15.0, 7.0),
-        "euler_ancestral": (5.0, 20.0, 8.0),
-        "heun": (3.0, 12.0, 6.0),
-        "dpm_2": (4.0, 15.0, 7.5),
-        "dpm_2_ancestral": (5.0, 18.0, 8.5),
-        "dpmpp_2s_ancestral": (6.0, 20.0, 9.0),
-        "dpmpp_sde": (5.0, 18.0, 8.0),
-        "dpmpp_2m": (4.0, 15.0, 7.0),
-        "ddim": (3.0, 12.0, 6.0),
-        "uni_pc": (3.0, 12.0, 6.5),
-        "uni_pc_bh2": (3.0, 12.0, 6.5),
-    }
-
-    return cfg_map.get(sampler_name, (1.0, 20.0, 7.0))
+    return _CFG_MAP.get(sampler_name, _DEFAULT_CFG)
 
 
 def get_sampler_info() -> Dict[str, Any]:
@@ -1,9 +1,11 @@
 """Sampler Combo node for ComfyUI."""
 
+import logging
 from typing import Tuple
 from ...base.base_node import ComfyAssetsBaseNode
 from .logic import (
-    get_sampler_combo,
+    _DEFAULT_COMBO,
+    _get_sampler_combo_unchecked,
     validate_sampler_settings,
     get_compatible_scheduler_suggestions,
     get_recommended_steps_range,
@@ -12,6 +14,8 @@ from .logic import (
     SCHEDULERS,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class SamplerComboNode(ComfyAssetsBaseNode):
     """
@@ -25,17 +29,18 @@ class SamplerComboNode(ComfyAssetsBaseNode):
     @classmethod
     def INPUT_TYPES(cls):
         """Define the input types for the ComfyUI node."""
+        # Built per call from ComfyUI's live sampler lists
         return {
             "required": {
                 "sampler_name": (
-                    SAMPLERS,
+                    list(SAMPLERS),
                     {
                         "default": "euler",
                         "tooltip": "Sampling algorithm",
                     },
                 ),
                 "scheduler": (
-                    SCHEDULERS,
+                    list(SCHEDULERS),
                     {
                         "default": "normal",
                         "tooltip": "Step distribution schedule",
@@ -64,6 +69,7 @@ class SamplerComboNode(ComfyAssetsBaseNode):
             }
         }
 
+    # Same list objects as KSampler's inputs, so the outputs stay connectable
     RETURN_TYPES = (SAMPLERS, SCHEDULERS, "INT", "FLOAT")
     RETURN_NAMES = ("sampler_name", "scheduler", "steps", "cfg")
     FUNCTION = "get_sampler_combo"
@@ -88,23 +94,19 @@ class SamplerComboNode(ComfyAssetsBaseNode):
             # Validate inputs
             if not validate_sampler_settings(sampler_name, scheduler, steps, cfg):
                 # Log the validation error but don't raise
-                import logging
-
-                logger = logging.getLogger(__name__)
                 logger.error(
                     f"{self.__class__.__name__}: Invalid sampler settings: "
                     f"sampler={sampler_name}, scheduler={scheduler}, "
                     f"steps={steps}, cfg={cfg}. "
                     f"Using safe defaults: euler, normal, 20 steps, CFG 7.0"
                 )
-                return ("euler", "normal", 20, 7.0)
+                return _DEFAULT_COMBO
 
-            # Process and return the combo
-            result = get_sampler_combo(sampler_name, scheduler, steps, cfg)
+            # Settings are already validated, so skip the second check
+            result = _get_sampler_combo_unchecked(sampler_name, scheduler, steps, cfg)
 
-            self.log_info(
-                f"Configured sampler combo: {result[0]}, {result[1]}, "
-                f"{result[2]} steps, CFG {result[3]}"
+            self.log_info_lazy(
+                "Configured sampler combo: %s, %s, %s steps, CFG %s", *result
             )
 
             # Return the sampler name as string, not object
@@ -112,14 +114,11 @@ class SamplerComboNode(ComfyAssetsBaseNode):
 
         except Exception as e:
             # Handle any unexpected errors gracefully
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.error(
                 f"{self.__class__.__name__}: Error processing sampler combo: {str(e)}. "
                 f"Using safe defaults: euler, normal, 20 steps, CFG 7.0"
             )
-            return ("euler", "normal", 20, 7.0)
+            return _DEFAULT_COMBO
 
     def validate_inputs(
         self, sampler_name: str, scheduler: str, steps: int, cfg: float
@@ -142,7 +141,7 @@ class SamplerComboNode(ComfyAssetsBaseNode):
                 f"scheduler={scheduler}, steps={steps}, cfg={cfg}"
             )
 
-    def get_scheduler_suggestions(self, sampler_name: str) -> list:
+    def get_scheduler_suggestions(self, sampler_name: str) -> Tuple[str, ...]:
         """
         Get scheduler suggestions compatible with the selected sampler.
 
@@ -150,7 +149,7 @@ class SamplerComboNode(ComfyAssetsBaseNode):
             sampler_name: The sampler algorithm name
 
         Returns:
-            List of recommended scheduler names
+            Tuple of recommended scheduler names
         """
         return get_compatible_scheduler_suggestions(sampler_name)
 
@@ -211,43 +210,43 @@ class SamplerComboNode(ComfyAssetsBaseNode):
             "steps": steps,
             "cfg": cfg,
             "valid": validate_sampler_settings(sampler_name, scheduler, steps, cfg),
-            "scheduler_suggestions": self.get_scheduler_suggestions(sampler_name),
-            "steps_rec": self.get_steps_recommendation(sampler_name),
-            "cfg_rec": self.get_cfg_recommendation(sampler_name),
         }
 
         # Add compatibility assessment
         suggested_schedulers = self.get_scheduler_suggestions(sampler_name)
+        analysis["scheduler_suggestions"] = suggested_schedulers
         analysis["scheduler_compatible"] = scheduler in suggested_schedulers
 
         # Add performance assessment
         steps_rec = self.get_steps_recommendation(sampler_name)
+        analysis["steps_rec"] = steps_rec
         analysis["steps_optimal"] = steps_rec["min"] <= steps <= steps_rec["max"]
 
         cfg_rec = self.get_cfg_recommendation(sampler_name)
+        analysis["cfg_rec"] = cfg_rec
         analysis["cfg_optimal"] = cfg_rec["min"] <= cfg <= cfg_rec["max"]
 
         return analysis
 
     @classmethod
-    def get_available_samplers(cls) -> list:
+    def get_available_samplers(cls) -> Tuple[str, ...]:
         """
-        Get list of available samplers.
+        Get available samplers.
 
         Returns:
-            List of sampler names
+            Tuple of sampler names
         """
-        return list(SAMPLERS)
+        return tuple(SAMPLERS)
 
     @classmethod
-    def get_available_schedulers(cls) -> list:
+    def get_available_schedulers(cls) -> Tuple[str, ...]:
         """
-        Get list of available schedulers.
+        Get available schedulers.
 
         Returns:
-            List of scheduler names
+            Tuple of scheduler names
         """
-        return list(SCHEDULERS)
+        return tuple(SCHEDULERS)
 
     def __str__(self) -> str:
         """String representation of the node."""
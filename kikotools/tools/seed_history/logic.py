@@ -2,17 +2,27 @@
 
 import random
 import time
-from typing import List, Dict, Any, Tuple, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 def generate_random_seed() -> int:
     """
-    Generate a cryptographically strong random seed value.
+    Generate a random seed value.
+
+    Uses the Mersenne Twister via random.getrandbits, which is fast but not
+    cryptographically strong; generation seeds do not need to be.
 
     Returns:
         Random integer in the valid ComfyUI seed range (0 to 2**32 - 1)
     """
-    return random.randint(0, 0xFFFFFFFF)  # 2**32 - 1
+    return random.getrandbits(32)  # 0 to 2**32 - 1
 
 
 def validate_seed_value(seed: Any) -> bool:
@@ -77,7 +87,8 @@ def create_history_entry(
         timestamp: Optional timestamp (uses current time if None)
 
     Returns:
-        Dictionary containing seed history entry
+        Dictionary containing seed history entry. The human-readable date
+        is not stored; use format_entry_date when it is needed.
     """
     if timestamp is None:
         timestamp = time.time()
@@ -85,12 +96,27 @@ def create_history_entry(
     return {
         "seed": seed,
         "timestamp": timestamp,
-        "dateString": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp)),
     }
 
 
+def format_entry_date(timestamp: float) -> str:
+    """
+    Format a history entry timestamp as a local date string.
+
+    Args:
+        timestamp: Unix timestamp
+
+    Returns:
+        Date string in "%Y-%m-%d %H:%M:%S" format
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
 def filter_duplicate_seeds(
-    history: List[Dict[str, Any]], new_seed: int, dedup_window_ms: int = 500
+    history: List[Dict[str, Any]],
+    new_seed: int,
+    dedup_window_ms: int = 500,
+    now: Optional[float] = None,
 ) -> bool:
     """
     Check if a seed should be filtered as a duplicate.
@@ -99,6 +125,7 @@ def filter_duplicate_seeds(
         history: Current seed history
         new_seed: New seed to check
         dedup_window_ms: Deduplication window in milliseconds
+        now: Optional current timestamp (uses current time if None)
 
     Returns:
         True if seed should be filtered (is duplicate), False otherwise
@@ -106,17 +133,16 @@ def filter_duplicate_seeds(
     if not history:
         return False
 
-    current_time = time.time() * 1000  # Convert to milliseconds
-
     # Check most recent entry for duplicates within window
     latest_entry = history[0]
-    latest_timestamp_ms = latest_entry["timestamp"] * 1000
+    if latest_entry["seed"] != new_seed:
+        return False
 
-    time_diff = current_time - latest_timestamp_ms
-    is_same_seed = latest_entry["seed"] == new_seed
-    is_within_window = time_diff < dedup_window_ms
+    if now is None:
+        now = time.time()
 
-    return is_same_seed and is_within_window
+    time_diff_ms = (now - latest_entry["timestamp"]) * 1000
+    return time_diff_ms < dedup_window_ms
 
 
 def add_seed_to_history(
@@ -129,7 +155,7 @@ def add_seed_to_history(
     Add a seed to the history with deduplication and size management.
 
     Args:
-        history: Current seed history
+        history: Current seed history (newest first)
         seed: Seed to add
         max_history: Maximum number of entries to keep
         dedup_window_ms: Deduplication window in milliseconds
@@ -137,32 +163,37 @@ def add_seed_to_history(
     Returns:
         Tuple of (updated_history, was_added)
     """
-    # Validate seed
-    if not validate_seed_value(seed):
-        return history, False
+    # Validate and convert the seed in one step; ComfyUI already passes
+    # ints, so skip the int() conversion for them
+    if type(seed) is int:
+        clean_seed = seed
+    else:
+        try:
+            clean_seed = int(seed)
+        except (ValueError, TypeError):
+            return history, False
 
-    # Sanitize seed
-    try:
-        clean_seed = sanitize_seed_value(seed)
-    except ValueError:
+    if not 0 <= clean_seed <= 0xFFFFFFFF:  # 2**32 - 1
         return history, False
 
+    # Read the clock once for both the dedup check and the new entry
+    now = time.time()
+
     # Check for duplicates
-    if filter_duplicate_seeds(history, clean_seed, dedup_window_ms):
+    if filter_duplicate_seeds(history, clean_seed, dedup_window_ms, now):
         return history, False
 
-    # Create new history list (don't modify original)
-    new_history = [entry for entry in history if entry["seed"] != clean_seed]
-
-    # Add new entry at the beginning
-    new_entry = create_history_entry(clean_seed)
-    new_history.insert(0, new_entry)
-
-    # Trim to max size
-    if len(new_history) > max_history:
-        new_history = new_history[:max_history]
+    # Create new history list (don't modify original), newest entry first.
+    # Stop copying once it is full instead of copying everything and trimming
+    new_history = [create_history_entry(clean_seed, now)]
+    for entry in history:
+        if len(new_history) >= max_history:
+            break
+        if entry["seed"] != clean_seed:
+            new_history.append(entry)
 
-    return new_history, True
+    # Trim to max size (only needed when max_history < 1)
+    return new_history[:max_history], True
 
 
 def format_time_ago(timestamp: float) -> str:
@@ -231,19 +262,27 @@ def get_history_statistics(history: List[Dict[str, Any]]) -> Dict[str, Any]:
             "unique_seeds": 0,
         }
 
-    timestamps = [entry["timestamp"] for entry in history]
-    oldest = min(timestamps)
-    newest = max(timestamps)
-    time_span = (newest - oldest) / 3600  # Convert to hours
+    # Single pass for the timestamp range and the distinct seeds
+    entries = iter(history)
+    first = next(entries)
+    oldest = newest = first["timestamp"]
+    seeds = {first["seed"]}
+    for entry in entries:
+        timestamp = entry["timestamp"]
+        if timestamp < oldest:
+            oldest = timestamp
+        elif timestamp > newest:
+            newest = timestamp
+        seeds.add(entry["seed"])
 
-    unique_seeds = len(set(entry["seed"] for entry in history))
+    time_span = (newest - oldest) / 3600  # Convert to hours
 
     return {
         "total_seeds": len(history),
         "oldest_timestamp": oldest,
         "newest_timestamp": newest,
         "time_span_hours": time_span,
-        "unique_seeds": unique_seeds,
+        "unique_seeds": len(seeds),
     }
 
 
@@ -276,15 +315,53 @@ def import_seeds_from_list(seed_list: List[int]) -> List[Dict[str, Any]]:
     """
     Import a list of seeds as history entries.
 
+    Range checks and timestamps are computed with NumPy so large imports
+    stay out of the per-seed Python loop. Lists that are not plain
+    integers (strings, floats, None, huge ints), or a missing NumPy, fall
+    back to per-seed validation.
+
     Args:
         seed_list: List of seed integers
 
     Returns:
         List of history entries
     """
-    history = []
     current_time = time.time()
 
+    if not NUMPY_AVAILABLE:
+        return _import_seeds_slow(seed_list, current_time)
+
+    try:
+        seeds = np.asarray(seed_list)
+    except ValueError:
+        seeds = None
+
+    # Anything but a flat integer array needs per-seed checks; an empty
+    # list has no integer dtype but is handled by the vectorized path
+    if (
+        seeds is None
+        or seeds.ndim != 1
+        or (seeds.size and seeds.dtype.kind not in "iu")
+    ):
+        return _import_seeds_slow(seed_list, current_time)
+
+    # Spread timestamps by 1 minute intervals (newest first)
+    valid = (seeds >= 0) & (seeds <= 0xFFFFFFFF)  # 2**32 - 1
+    indices = np.flatnonzero(valid)
+    timestamps = current_time - indices * 60.0
+
+    return [
+        {"seed": seed, "timestamp": timestamp}
+        for seed, timestamp in zip(seeds[indices].tolist(), timestamps.tolist())
+    ]
+
+
+def _import_seeds_slow(
+    seed_list: List[Any], current_time: float
+) -> List[Dict[str, Any]]:
+    """Per-seed fallback for import_seeds_from_list."""
+    history = []
+
     for i, seed in enumerate(seed_list):
         if validate_seed_value(seed):
             # Spread timestamps by 1 minute intervals (newest first)
@@ -1,13 +1,47 @@
 """Seed History node for ComfyUI."""
 
+import logging
+from functools import lru_cache
 from typing import Tuple
 from ...base.base_node import ComfyAssetsBaseNode
 from .logic import (
     generate_random_seed,
     validate_seed_value,
-    sanitize_seed_value,
 )
 
+logger = logging.getLogger(__name__)
+
+# Seeds with a fixed description; neither is a power of 2 or a round number
+_SPECIAL_SEED_TYPES = {0: "zero", 12345: "default"}
+
+# Every power of 2 in the valid seed range (0 to 2**32 - 1)
+_POWERS_OF_2 = frozenset(1 << i for i in range(32))
+
+
+def _is_round_number(seed: int) -> bool:
+    """Check whether more than half of the decimal digits are zeros."""
+    digits = str(seed)
+    return digits.count("0") * 2 > len(digits)
+
+
+@lru_cache(maxsize=256)
+def _seed_info_str(seed: int) -> str:
+    """Build the description returned by SeedHistoryNode.get_seed_info."""
+    # Convert to hex for additional info
+    hex_value = hex(seed)
+
+    # Check if it's a "nice" number (special value, power of 2, round number)
+    seed_type = _SPECIAL_SEED_TYPES.get(seed)
+    if seed_type is None:
+        if seed in _POWERS_OF_2:
+            seed_type = "power of 2"
+        elif _is_round_number(seed):
+            seed_type = "round number"
+        else:
+            seed_type = "standard"
+
+    return f"Seed {seed} ({hex_value}) - {seed_type}"
+
 
 class SeedHistoryNode(ComfyAssetsBaseNode):
     """
@@ -41,6 +75,8 @@ class SeedHistoryNode(ComfyAssetsBaseNode):
     FUNCTION = "output_seed"
     CATEGORY = "🫶 ComfyAssets/🌱 Seeds"
 
+    _SEED_RANGE_INFO = f"Valid range: 0 to {0xFFFFFFFF:,} ({hex(0xFFFFFFFF)})"
+
     def output_seed(self, seed: int, **kwargs) -> Tuple[int]:
         """
         Output the seed value for use in other nodes.
@@ -52,31 +88,26 @@ class SeedHistoryNode(ComfyAssetsBaseNode):
         Returns:
             Tuple containing the seed value
         """
-        try:
-            # Validate and sanitize the seed
-            if not validate_seed_value(seed):
-                import logging
-
-                logger = logging.getLogger(__name__)
-                logger.error(
-                    f"{self.__class__.__name__}: Invalid seed value: {seed}. "
-                    f"Using fallback seed 12345."
-                )
-                return (12345,)
-
-            clean_seed = sanitize_seed_value(seed)
-            return (clean_seed,)
-
-        except Exception as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
+        # Validate and convert the seed in one step; ComfyUI already passes
+        # ints, so skip the int() conversion for them
+        if type(seed) is int:
+            clean_seed = seed
+        else:
+            try:
+                clean_seed = int(seed)
+            except (ValueError, TypeError, OverflowError):
+                clean_seed = None
+
+        if clean_seed is None or not 0 <= clean_seed <= 0xFFFFFFFF:  # 2**32 - 1
             logger.error(
-                f"{self.__class__.__name__}: Error processing seed: {str(e)}. "
-                f"Using fallback seed 12345."
+                "%s: Invalid seed value: %s. Using fallback seed 12345.",
+                self.__class__.__name__,
+                seed,
             )
             return (12345,)
 
+        return (clean_seed,)
+
     def generate_new_seed(self) -> int:
         """
         Generate a new random seed value.
@@ -118,21 +149,7 @@ class SeedHistoryNode(ComfyAssetsBaseNode):
         if not validate_seed_value(seed):
             return f"Invalid seed: {seed} (outside valid range)"
 
-        # Convert to hex for additional info
-        hex_value = hex(seed)
-
-        # Check if it's a "nice" number (power of 2, round number, etc.)
-        seed_type = "standard"
-        if seed == 0:
-            seed_type = "zero"
-        elif seed & (seed - 1) == 0:  # Power of 2
-            seed_type = "power of 2"
-        elif str(seed).count("0") > len(str(seed)) // 2:
-            seed_type = "round number"
-        elif seed == 12345:
-            seed_type = "default"
-
-        return f"Seed {seed} ({hex_value}) - {seed_type}"
+        return _seed_info_str(seed)
 
     def get_seed_range_info(self) -> str:
         """
@@ -141,8 +158,7 @@ class SeedHistoryNode(ComfyAssetsBaseNode):
         Returns:
             Range information string
         """
-        max_seed = 0xFFFFFFFF  # 2**32 - 1
-        return f"Valid range: 0 to {max_seed:,} ({hex(max_seed)})"
+        return self._SEED_RANGE_INFO
 
     @classmethod
     def get_default_seed(cls) -> int:
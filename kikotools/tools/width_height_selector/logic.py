@@ -1,10 +1,21 @@
 """Core logic for Width Height Selector tool."""
 
-from typing import Tuple
+import heapq
+from functools import lru_cache
 from math import gcd
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
 from .presets import PRESET_OPTIONS
 
+# (preset name, width / height) for every non-custom preset, computed once
+_PRESET_RATIOS = tuple(
+    (preset_name, preset_width / preset_height)
+    for preset_name, (preset_width, preset_height) in PRESET_OPTIONS.items()
+    if preset_name != "custom"
+)
 
+
+@lru_cache(maxsize=512, typed=True)
 def get_preset_dimensions(
     preset: str, custom_width: int, custom_height: int
 ) -> Tuple[int, int]:
@@ -19,10 +30,10 @@ def get_preset_dimensions(
     Returns:
         Tuple of (width, height) as integers
     """
-    if preset == "custom" or preset not in PRESET_OPTIONS:
+    if preset == "custom":
         return custom_width, custom_height
 
-    return PRESET_OPTIONS[preset]
+    return PRESET_OPTIONS.get(preset, (custom_width, custom_height))
 
 
 def apply_swap_logic(width: int, height: int, swap_enabled: bool) -> Tuple[int, int]:
@@ -42,6 +53,7 @@ def apply_swap_logic(width: int, height: int, swap_enabled: bool) -> Tuple[int,
     return width, height
 
 
+@lru_cache(maxsize=512, typed=True)
 def calculate_aspect_ratio(width: int, height: int) -> str:
     """
     Calculate and format aspect ratio as a string.
@@ -64,6 +76,7 @@ def calculate_aspect_ratio(width: int, height: int) -> str:
     return f"{ratio_width}:{ratio_height}"
 
 
+@lru_cache(maxsize=512, typed=True)
 def validate_dimensions(width: int, height: int) -> bool:
     """
     Validate that dimensions meet ComfyUI requirements.
@@ -90,11 +103,13 @@ def validate_dimensions(width: int, height: int) -> bool:
     return True
 
 
+@lru_cache(maxsize=512, typed=True)
 def sanitize_dimensions(width: int, height: int) -> Tuple[int, int]:
     """
     Sanitize dimensions to meet ComfyUI requirements.
 
-    Rounds to nearest multiple of 8 and clamps to valid range.
+    Rounds to nearest multiple of 8 and clamps to valid range, so the
+    result always passes validate_dimensions.
 
     Args:
         width: Raw width value
@@ -129,6 +144,15 @@ def get_dimension_info(
     Returns:
         Dictionary with dimension info and metadata
     """
+    # Fresh dict per call, so callers may modify or serialize it
+    return dict(_cached_dimension_info(preset, width, height, swap_enabled))
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _cached_dimension_info(
+    preset: str, width: int, height: int, swap_enabled: bool
+) -> Mapping[str, Any]:
+    """Build get_dimension_info's result once per input combination."""
     # Get base dimensions from preset or custom
     base_width, base_height = get_preset_dimensions(preset, width, height)
 
@@ -145,20 +169,23 @@ def get_dimension_info(
     # Calculate megapixels
     megapixels = (final_width * final_height) / 1_000_000
 
-    return {
-        "width": final_width,
-        "height": final_height,
-        "aspect_ratio": aspect_ratio,
-        "is_valid": is_valid,
-        "is_square": is_square,
-        "is_landscape": is_landscape,
-        "is_portrait": is_portrait,
-        "megapixels": round(megapixels, 2),
-        "preset_used": preset,
-        "swap_applied": swap_enabled,
-    }
-
-
+    return MappingProxyType(
+        {
+            "width": final_width,
+            "height": final_height,
+            "aspect_ratio": aspect_ratio,
+            "is_valid": is_valid,
+            "is_square": is_square,
+            "is_landscape": is_landscape,
+            "is_portrait": is_portrait,
+            "megapixels": round(megapixels, 2),
+            "preset_used": preset,
+            "swap_applied": swap_enabled,
+        }
+    )
+
+
+@lru_cache(maxsize=512, typed=True)
 def format_dimension_string(width: int, height: int) -> str:
     """
     Format dimensions as a readable string.
@@ -186,20 +213,17 @@ def parse_dimension_string(dimension_str: str) -> Tuple[int, int]:
     Raises:
         ValueError: If dimension string cannot be parsed
     """
-    # Handle both × and x separators
-    if "×" in dimension_str:
-        parts = dimension_str.split("×")
-    elif "x" in dimension_str:
-        parts = dimension_str.split("x")
-    else:
+    # Normalize the × separator to x so a single partition handles both
+    width_str, separator, height_str = dimension_str.replace("×", "x").partition("x")
+    if not separator:
         raise ValueError(f"Invalid dimension string format: {dimension_str}")
 
-    if len(parts) != 2:
+    if "x" in height_str:
         raise ValueError(f"Dimension string must have exactly 2 parts: {dimension_str}")
 
     try:
-        width = int(parts[0].strip())
-        height = int(parts[1].strip())
+        width = int(width_str.strip())
+        height = int(height_str.strip())
         return width, height
     except ValueError as e:
         raise ValueError(f"Could not parse dimensions from {dimension_str}: {e}")
@@ -242,23 +266,25 @@ def suggest_similar_presets(width: int, height: int, max_suggestions: int = 3) -
     Returns:
         List of preset names sorted by similarity
     """
-    if width <= 0 or height <= 0:
-        return []
-
-    current_ratio = width / height
-    suggestions = []
+    return list(_suggest_similar_presets(width, height, max_suggestions))
 
-    for preset_name, (preset_width, preset_height) in PRESET_OPTIONS.items():
-        if preset_name == "custom":
-            continue
 
-        preset_ratio = preset_width / preset_height
-        ratio_diff = abs(current_ratio - preset_ratio)
+@lru_cache(maxsize=256)
+def _suggest_similar_presets(
+    width: int, height: int, max_suggestions: int
+) -> Tuple[str, ...]:
+    """Cached implementation of suggest_similar_presets."""
+    if width <= 0 or height <= 0:
+        return ()
 
-        suggestions.append((preset_name, ratio_diff))
+    current_ratio = width / height
 
-    # Sort by similarity (smallest ratio difference first)
-    suggestions.sort(key=lambda x: x[1])
+    # Only the closest few are needed, so avoid sorting every preset
+    closest = heapq.nsmallest(
+        max_suggestions,
+        _PRESET_RATIOS,
+        key=lambda preset: abs(current_ratio - preset[1]),
+    )
 
     # Return just the preset names
-    return [preset[0] for preset in suggestions[:max_suggestions]]
+    return tuple(preset[0] for preset in closest)
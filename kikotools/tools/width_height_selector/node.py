@@ -1,5 +1,6 @@
 """Width Height Selector node for ComfyUI."""
 
+import logging
 from typing import Tuple
 from ...base.base_node import ComfyAssetsBaseNode
 from .logic import (
@@ -8,13 +9,24 @@ from .logic import (
     sanitize_dimensions,
 )
 from .presets import (
+    FORMATTED_PRESET_OPTIONS,
+    MODEL_GROUPS,
     PRESET_OPTIONS,
-    PRESET_METADATA,
+    PRESET_INFO_STRINGS,
     get_model_recommendation,
     get_preset_metadata,
     get_presets_by_model_group,
 )
 
+logger = logging.getLogger(__name__)
+
+
+# Dropdown label or raw preset name -> preset name
+_FORMATTED_TO_KEY = {
+    **{name: name for name in PRESET_OPTIONS},
+    **dict(zip(FORMATTED_PRESET_OPTIONS, PRESET_OPTIONS)),
+}
+
 
 class WidthHeightSelectorNode(ComfyAssetsBaseNode):
     """
@@ -24,63 +36,50 @@ class WidthHeightSelectorNode(ComfyAssetsBaseNode):
     optimized for SDXL and FLUX models with comprehensive aspect ratio support.
     """
 
+    # Presets are static, so build the input spec once for every UI query
+    _INPUT_TYPES = {
+        "required": {
+            "preset": (
+                FORMATTED_PRESET_OPTIONS,
+                {
+                    "default": "custom",
+                    "tooltip": "Select from optimized resolution presets or use "
+                    "custom dimensions. SDXL presets are ~1MP, FLUX presets are "
+                    "higher resolution, Ultra-wide presets support modern "
+                    "aspect ratios.",
+                },
+            ),
+            "width": (
+                "INT",
+                {
+                    "default": 1024,
+                    "min": 64,
+                    "max": 8192,
+                    "step": 8,
+                    "tooltip": "Custom width in pixels (must be multiple of 8). "
+                    "Used when preset is 'custom' or as fallback for invalid "
+                    "presets.",
+                },
+            ),
+            "height": (
+                "INT",
+                {
+                    "default": 1024,
+                    "min": 64,
+                    "max": 8192,
+                    "step": 8,
+                    "tooltip": "Custom height in pixels (must be multiple of 8). "
+                    "Used when preset is 'custom' or as fallback for invalid "
+                    "presets.",
+                },
+            ),
+        }
+    }
+
     @classmethod
     def INPUT_TYPES(cls):
         """Define the input types for the ComfyUI node."""
-        # Create formatted preset options with metadata
-        preset_options = ["custom"]  # Custom first
-
-        # Add formatted presets with metadata
-        for preset_name in PRESET_OPTIONS.keys():
-            if preset_name != "custom":
-                metadata = PRESET_METADATA.get(preset_name)
-                if metadata:
-                    formatted_option = (
-                        f"{preset_name} - {metadata.aspect_ratio} "
-                        f"({metadata.megapixels:.1f}MP) - {metadata.model_group}"
-                    )
-                    preset_options.append(formatted_option)
-                else:
-                    preset_options.append(preset_name)
-
-        return {
-            "required": {
-                "preset": (
-                    preset_options,
-                    {
-                        "default": "custom",
-                        "tooltip": "Select from optimized resolution presets or use "
-                        "custom dimensions. SDXL presets are ~1MP, FLUX presets are "
-                        "higher resolution, Ultra-wide presets support modern "
-                        "aspect ratios.",
-                    },
-                ),
-                "width": (
-                    "INT",
-                    {
-                        "default": 1024,
-                        "min": 64,
-                        "max": 8192,
-                        "step": 8,
-                        "tooltip": "Custom width in pixels (must be multiple of 8). "
-                        "Used when preset is 'custom' or as fallback for invalid "
-                        "presets.",
-                    },
-                ),
-                "height": (
-                    "INT",
-                    {
-                        "default": 1024,
-                        "min": 64,
-                        "max": 8192,
-                        "step": 8,
-                        "tooltip": "Custom height in pixels (must be multiple of 8). "
-                        "Used when preset is 'custom' or as fallback for invalid "
-                        "presets.",
-                    },
-                ),
-            }
-        }
+        return cls._INPUT_TYPES
 
     RETURN_TYPES = ("INT", "INT")
     RETURN_NAMES = ("width", "height")
@@ -98,6 +97,9 @@ class WidthHeightSelectorNode(ComfyAssetsBaseNode):
 
         Returns:
             Tuple of (width, height)
+
+        Raises:
+            ValueError: If the width or height input is not a usable number
         """
         try:
             # Extract original preset name from formatted string if needed
@@ -108,27 +110,15 @@ class WidthHeightSelectorNode(ComfyAssetsBaseNode):
                 original_preset, width, height
             )
 
-            # Sanitize dimensions to ensure they meet ComfyUI requirements
-            final_width, final_height = sanitize_dimensions(final_width, final_height)
+            # Sanitized dimensions always pass validate_dimensions, so they
+            # need no second check
+            return sanitize_dimensions(final_width, final_height)
 
-            # Validate final dimensions
-            if not validate_dimensions(final_width, final_height):
-                # This should not happen after sanitization, but handle gracefully
-                self.handle_error(
-                    f"Generated invalid dimensions: {final_width}×{final_height}. "
-                    f"Using fallback dimensions 1024×1024."
-                )
-                final_width, final_height = 1024, 1024
-
-            return (final_width, final_height)
-
-        except Exception as e:
-            # Handle any unexpected errors gracefully
-            error_msg = (
-                f"Error processing dimensions: {str(e)}. Using fallback 1024×1024."
-            )
-            self.handle_error(error_msg)
-            return (1024, 1024)
+        except (ValueError, TypeError, KeyError) as e:
+            # Only bad input values can fail here
+            error_msg = f"Error processing dimensions: {e}"
+            logger.error(f"{self.__class__.__name__}: {error_msg}")
+            raise ValueError(error_msg) from e
 
     def _extract_preset_name(self, formatted_preset: str) -> str:
         """
@@ -140,24 +130,21 @@ class WidthHeightSelectorNode(ComfyAssetsBaseNode):
         Returns:
             Original preset name
         """
-        # If it's already "custom", return as-is
-        if formatted_preset == "custom":
-            return formatted_preset
+        # Known dropdown labels and raw preset names (including "custom")
+        preset_name = _FORMATTED_TO_KEY.get(formatted_preset)
+        if preset_name is not None:
+            return preset_name
 
-        # If it contains formatting metadata, extract the resolution part
+        # Labels saved with older metadata: extract the resolution part
         if " - " in formatted_preset:
             # Format is: "1024×1024 - 1:1 (1.0MP) - SDXL"
             # Extract the first part (resolution)
-            resolution_part = formatted_preset.split(" - ")[0]
+            resolution_part = formatted_preset.partition(" - ")[0]
 
             # Verify this is a valid preset name
             if resolution_part in PRESET_OPTIONS:
                 return resolution_part
 
-        # If no formatting or not found, check if it's directly a valid preset
-        if formatted_preset in PRESET_OPTIONS:
-            return formatted_preset
-
         # Default to "custom" if we can't parse it
         return "custom"
 
@@ -174,14 +161,7 @@ class WidthHeightSelectorNode(ComfyAssetsBaseNode):
         if preset == "custom":
             return "Custom dimensions - use the width and height inputs below"
 
-        metadata = get_preset_metadata(preset)
-        if metadata.width > 0:  # Valid metadata
-            return (
-                f"{preset} - {metadata.aspect_ratio} ({metadata.megapixels:.1f}MP) - "
-                f"{metadata.description}"
-            )
-
-        return f"Unknown preset: {preset}"
+        return PRESET_INFO_STRINGS.get(preset, f"Unknown preset: {preset}")
 
     def get_model_optimization(self, preset: str) -> str:
         """
@@ -242,9 +222,7 @@ class WidthHeightSelectorNode(ComfyAssetsBaseNode):
         Returns:
             Tuple of (width, height) or (0, 0) if invalid
         """
-        if preset in PRESET_OPTIONS:
-            return PRESET_OPTIONS[preset]
-        return (0, 0)
+        return PRESET_OPTIONS.get(preset, (0, 0))
 
     @classmethod
     def get_presets_by_model(cls, model_group: str) -> dict:
@@ -270,17 +248,8 @@ class WidthHeightSelectorNode(ComfyAssetsBaseNode):
         Returns:
             Dictionary with metadata information
         """
-        metadata = get_preset_metadata(preset)
-        return {
-            "width": metadata.width,
-            "height": metadata.height,
-            "aspect_ratio": metadata.aspect_ratio,
-            "aspect_decimal": metadata.aspect_decimal,
-            "megapixels": metadata.megapixels,
-            "model_group": metadata.model_group,
-            "category": metadata.category,
-            "description": metadata.description,
-        }
+        # PresetMetadata fields match the dictionary keys
+        return get_preset_metadata(preset)._asdict()
 
     @classmethod
     def get_model_groups(cls) -> list:
@@ -290,7 +259,7 @@ class WidthHeightSelectorNode(ComfyAssetsBaseNode):
         Returns:
             List of model group names
         """
-        return list(set(metadata.model_group for metadata in PRESET_METADATA.values()))
+        return list(MODEL_GROUPS)
 
     def __str__(self) -> str:
         """String representation of the node."""
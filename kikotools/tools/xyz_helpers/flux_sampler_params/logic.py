@@ -1,5 +1,6 @@
 """Logic module for Flux Sampler Params node."""
 
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional
 import random
 import logging
@@ -21,20 +22,66 @@ def parse_string_to_list(value: str) -> List[float]:
         return []
 
     try:
-        values = []
-        for item in value.split(","):
-            item = item.strip()
-            if item:
-                try:
-                    values.append(float(item))
-                except ValueError:
-                    logger.warning(f"Could not parse '{item}' as float")
-        return values
+        # Fresh list per call so callers may mutate it without touching the cache
+        return list(_parse_float_values(value))
+    except Exception as e:
+        logger.error(f"Error parsing string to list: {e}")
+        return []
+
+
+@lru_cache(maxsize=64)
+def _parse_float_values(value: str) -> Tuple[float, ...]:
+    """
+    Parse comma-separated floats once per distinct widget string.
+
+    The node parses several fields per run, and the strings rarely change
+    between runs, so repeated values skip the split and float conversion.
+
+    Args:
+        value: String with comma-separated values
+
+    Returns:
+        Tuple of float values
+    """
+    values = []
+    for item in value.split(","):
+        item = item.strip()
+        if item:
+            try:
+                values.append(float(item))
+            except ValueError:
+                logger.warning(f"Could not parse '{item}' as float")
+    return tuple(values)
+
+
+def parse_string_to_int_list(value: str) -> List[int]:
+    """
+    Parse a string containing comma-separated numbers to a list of ints.
+
+    Values are parsed as floats and truncated, so "20.0" gives 20.
+
+    Args:
+        value: String with comma-separated values
+
+    Returns:
+        List of integer values
+    """
+    if not value or not value.strip():
+        return []
+
+    try:
+        return list(_parse_int_values(value))
     except Exception as e:
         logger.error(f"Error parsing string to list: {e}")
         return []
 
 
+@lru_cache(maxsize=64)
+def _parse_int_values(value: str) -> Tuple[int, ...]:
+    """Truncate the cached float parse of a widget string to ints once."""
+    return tuple(int(v) for v in _parse_float_values(value))
+
+
 def parse_seed_string(seed_string: str) -> List[int]:
     """
     Parse seed string which can contain numbers, '?', or ranges.
@@ -88,13 +135,15 @@ def parse_sampler_string(
     if sampler_string == "*":
         return available_samplers.copy()
 
+    items = sampler_string.replace("\n", ",").split(",")
+
     if sampler_string.startswith("!"):
-        excluded = sampler_string.replace("\n", ",").split(",")
-        excluded = [s.strip("! ") for s in excluded]
+        excluded = {s.strip("! ") for s in items}
         return [s for s in available_samplers if s not in excluded]
 
-    samplers = sampler_string.replace("\n", ",").split(",")
-    samplers = [s.strip() for s in samplers if s.strip() in available_samplers]
+    # Strip each entry once and test membership against a set
+    available = set(available_samplers)
+    samplers = [s for s in (item.strip() for item in items) if s in available]
 
     if not samplers:
         return ["euler"]
@@ -118,13 +167,15 @@ def parse_scheduler_string(
     if scheduler_string == "*":
         return available_schedulers.copy()
 
+    items = scheduler_string.replace("\n", ",").split(",")
+
     if scheduler_string.startswith("!"):
-        excluded = scheduler_string.replace("\n", ",").split(",")
-        excluded = [s.strip("! ") for s in excluded]
+        excluded = {s.strip("! ") for s in items}
         return [s for s in available_schedulers if s not in excluded]
 
-    schedulers = scheduler_string.replace("\n", ",").split(",")
-    schedulers = [s.strip() for s in schedulers if s.strip() in available_schedulers]
+    # Strip each entry once and test membership against a set
+    available = set(available_schedulers)
+    schedulers = [s for s in (item.strip() for item in items) if s in available]
 
     if not schedulers:
         return ["simple"]
@@ -6,6 +6,7 @@ import logging
 from ....base.base_node import ComfyAssetsBaseNode
 from .logic import (
     parse_string_to_list,
+    parse_string_to_int_list,
     parse_seed_string,
     parse_sampler_string,
     parse_scheduler_string,
@@ -214,7 +215,7 @@ class FluxSamplerParamsNode(ComfyAssetsBaseNode):
             )
 
             steps = steps if steps else str(defaults["steps"])
-            steps_list = [int(s) for s in parse_string_to_list(steps)]
+            steps_list = parse_string_to_int_list(steps)
 
             guidance = guidance if guidance else str(defaults["guidance"])
             guidance_list = parse_string_to_list(guidance)
@@ -1,5 +1,6 @@
 """Logic module for LoRA Folder Batch node."""
 
+import math
 import os
 import re
 from typing import List, Dict, Any
@@ -148,21 +149,8 @@ def sort_lora_files(lora_files: List[str], sort_order: str) -> List[str]:
     Returns:
         Sorted list of LoRA files
     """
-    if sort_order == "natural":
-        return natural_sort(lora_files)
-    elif sort_order == "alphabetical":
-        return sorted(lora_files)
-    elif sort_order in ["newest", "oldest"]:
-        # For time-based sorting, we need the actual file stats
-        # Since we only have relative paths, we'll sort by name for now
-        # This could be enhanced if we have access to file stats
-        sorted_files = natural_sort(lora_files)
-        if sort_order == "oldest":
-            return sorted_files
-        else:  # newest
-            return sorted_files[::-1]
-    else:
-        return lora_files
+    sorter = _LORA_SORTERS.get(sort_order)
+    return sorter(lora_files) if sorter else lora_files
 
 
 def natural_sort(items: List[str]) -> List[str]:
@@ -197,6 +185,21 @@ def natural_sort(items: List[str]) -> List[str]:
     return sorted(items, key=natural_key)
 
 
+def _natural_sort_reversed(items: List[str]) -> List[str]:
+    """Sort strings naturally, last first."""
+    return natural_sort(items)[::-1]
+
+
+# Sort order -> sorter, so sort_lora_files is a single lookup.
+_LORA_SORTERS = {
+    "natural": natural_sort,
+    "alphabetical": sorted,
+    # Only relative paths are available, so time orders fall back to names
+    "oldest": natural_sort,
+    "newest": _natural_sort_reversed,
+}
+
+
 def filter_loras_by_pattern(
     lora_files: List[str], include_pattern: str = "", exclude_pattern: str = ""
 ) -> List[str]:
@@ -269,14 +272,13 @@ def parse_strength_string(strength_str: str) -> List[float]:  # noqa: C901
                     end = float(end_part)
                     step = 0.1  # Default step
 
-                # Generate range
-                values = []
-                current = start
-                while current <= end + 0.0001:  # Small epsilon for float comparison
-                    values.append(round(current, 4))
-                    current += step
+                if step <= 0:
+                    raise ValueError(f"step must be positive, got {step}")
 
-                return values
+                # Generate range from the index rather than by repeated addition,
+                # so float error does not accumulate across steps
+                count = math.floor((end - start + 0.0001) / step) + 1  # Small epsilon
+                return [round(start + i * step, 4) for i in range(max(count, 0))]
             except ValueError as e:
                 logger.error(f"Invalid range format: {e}")
                 return [1.0]
@@ -3,6 +3,7 @@
 from typing import Tuple, Any, List, Dict
 import os
 import math
+from functools import lru_cache
 import torch
 import torch.nn.functional as F
 import logging
@@ -45,6 +46,79 @@ from .logic import (
 logger = logging.getLogger(__name__)
 
 
+# Monospace fonts to try, in order of preference
+_FONT_CANDIDATES = (
+    # Check if ComfyUI_essentials font exists
+    os.path.join(
+        os.path.dirname(__file__),
+        "../../../../referance/ComfyUI_essentials/fonts/ShareTechMono-Regular.ttf",
+    ),
+    # System fonts
+    "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
+    "/System/Library/Fonts/Courier.dfont",
+    "C:\\Windows\\Fonts\\cour.ttf",
+)
+
+
+@lru_cache(maxsize=1)
+def _find_font_path() -> str:
+    """
+    Find the first available font, probing the filesystem only once.
+
+    Returns:
+        Path to font file
+    """
+    for path in _FONT_CANDIDATES:
+        if os.path.exists(path):
+            return path
+
+    # Return a default that PIL will handle
+    return "arial.ttf"
+
+
+@lru_cache(maxsize=16)
+def _load_font(font_path: str, font_size: int):
+    """
+    Load a TrueType font once per path and size.
+
+    Args:
+        font_path: Path to the font file
+        font_size: Font size in pixels
+
+    Returns:
+        Loaded font, or PIL's default font if the file cannot be read
+    """
+    try:
+        return ImageFont.truetype(font_path, font_size)
+    except (IOError, OSError):
+        logger.warning(f"Could not load font from {font_path}, using default")
+        return ImageFont.load_default()
+
+
+# Padding in pixels around each line of annotation text
+_TEXT_PADDING = 3
+
+
+@lru_cache(maxsize=16)
+def _font_metrics(font_path: str, font_size: int) -> Tuple[int, int]:
+    """
+    Measure the annotation line height and character width for a font.
+
+    Args:
+        font_path: Path to the font file
+        font_size: Font size in pixels
+
+    Returns:
+        Tuple of (line_height, char_width) in pixels
+    """
+    font = _load_font(font_path, font_size)
+    line_height = (
+        font.getmask("Q").getbbox()[3] + font.getmetrics()[1] + _TEXT_PADDING * 2
+    )
+    char_width = font.getbbox("M")[2] + 1  # Monospace approximation
+    return line_height, char_width
+
+
 class PlotParametersNode(ComfyAssetsBaseNode):
     """
     Plot Parameters node for visualizing batch sampling results.
@@ -175,87 +249,73 @@ class PlotParametersNode(ComfyAssetsBaseNode):
             width = images.shape[2]
             font_size = min(48, int(32 * (width / 1024)))
 
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-            except (IOError, OSError):
-                logger.warning(f"Could not load font from {font_path}, using default")
-                font = ImageFont.load_default()
+            font = _load_font(font_path, font_size)
 
             # Calculate text dimensions
-            text_padding = 3
-            line_height = (
-                font.getmask("Q").getbbox()[3] + font.getmetrics()[1] + text_padding * 2
-            )
-            char_width = font.getbbox("M")[2] + 1  # Monospace approximation
-
-            # Process each image
-            out_images = []
-            for image, param in zip(images, _params):
-                image = image.permute(2, 0, 1)  # [C, H, W]
-
-                # Add parameter text
-                if add_params != "false":
-                    param_text = format_parameter_text(
-                        param,
-                        "changes only" if add_params == "changes only" else "full",
+            text_padding = _TEXT_PADDING
+            line_height, char_width = _font_metrics(font_path, font_size)
+
+            # Render the annotation strips for each image; everything is copied
+            # into one preallocated batch below. Batches usually share prompts
+            # (and often parameter text), so each distinct strip is drawn once
+            cols = math.ceil(width / char_width)
+            strips = {}
+
+            def render_strip(lines):
+                key = tuple(lines)
+                strip = strips.get(key)
+                if strip is None:
+                    text_image = Image.new(
+                        "RGB", (width, line_height * len(key)), color=(0, 0, 0)
                     )
-
-                    lines = param_text.split("\n")
-                    text_height = line_height * len(lines)
-                    text_image = Image.new("RGB", (width, text_height), color=(0, 0, 0))
                     draw = ImageDraw.Draw(text_image)
-
-                    for i, line in enumerate(lines):
+                    for i, line in enumerate(key):
                         draw.text(
                             (text_padding, i * line_height + text_padding),
                             line,
                             font=font,
                             fill=(255, 255, 255),
                         )
+                    strip = T.ToTensor()(text_image).permute(1, 2, 0)
+                    strips[key] = strip
+                return strip
 
-                    text_tensor = T.ToTensor()(text_image).to(image.device)
-                    image = torch.cat([image, text_tensor], 1)
-
-                # Add prompt text
-                if add_prompt != "false" and "prompt" in param and param["prompt"]:
-                    cols = math.ceil(width / char_width)
-                    prompt_lines = wrap_prompt_text(
-                        param["prompt"],
-                        cols,
-                        "excerpt" if add_prompt == "excerpt" else "full",
-                    )
+            # Resolve the annotation modes once; None disables that strip
+            params_mode = {"false": None, "changes only": "changes only"}.get(
+                add_params, "full"
+            )
+            prompt_mode = {"false": None, "excerpt": "excerpt"}.get(add_prompt, "full")
 
-                    prompt_height = line_height * len(prompt_lines)
-                    prompt_image = Image.new(
-                        "RGB", (width, prompt_height), color=(0, 0, 0)
-                    )
-                    draw = ImageDraw.Draw(prompt_image)
+            columns = []
+            for image, param in zip(images, _params):
+                parts = [image]  # [H, W, C]
 
-                    for i, line in enumerate(prompt_lines):
-                        draw.text(
-                            (text_padding, i * line_height + text_padding),
-                            line,
-                            font=font,
-                            fill=(255, 255, 255),
-                        )
+                # Add parameter text
+                if params_mode:
+                    param_text = format_parameter_text(param, params_mode)
+                    parts.append(render_strip(param_text.split("\n")))
 
-                    prompt_tensor = T.ToTensor()(prompt_image).to(image.device)
-                    image = torch.cat([image, prompt_tensor], 1)
+                # Add prompt text
+                if prompt_mode and param.get("prompt"):
+                    prompt_lines = wrap_prompt_text(param["prompt"], cols, prompt_mode)
+                    parts.append(render_strip(prompt_lines))
 
-                # Clean up NaN values
-                image = torch.nan_to_num(image, nan=0.0).clamp(0.0, 1.0)
-                out_images.append(image)
+                columns.append(parts)
 
-            # Ensure all images have same height
-            if add_prompt != "false" or add_params == "changes only":
-                max_height = max([img.shape[1] for img in out_images])
-                out_images = [
-                    F.pad(img, (0, 0, 0, max_height - img.shape[1]))
-                    for img in out_images
-                ]
+            # Stack each image above its strips in a [B, H, W, C] batch; shorter
+            # columns keep the zero (black) padding at the bottom
+            max_height = max(sum(part.shape[0] for part in parts) for parts in columns)
+            out_image = images.new_zeros(
+                (len(columns), max_height, width, images.shape[3])
+            )
+            for out, parts in zip(out_image, columns):
+                top = 0
+                for part in parts:
+                    out[top : top + part.shape[0]].copy_(part)
+                    top += part.shape[0]
 
-            # Stack images
-            out_image = torch.stack(out_images, 0).permute(0, 2, 3, 1)  # [B, H, W, C]
+            # Clean up NaN values for the whole batch at once
+            out_image.nan_to_num_(nan=0.0).clamp_(0.0, 1.0)
 
             # Create grid if columns specified
             if cols_num > -1:
@@ -288,22 +348,4 @@ class PlotParametersNode(ComfyAssetsBaseNode):
         Returns:
             Path to font file
         """
-        # Try to find a monospace font
-        possible_paths = [
-            # Check if ComfyUI_essentials font exists
-            os.path.join(
-                os.path.dirname(__file__),
-                "../../../../referance/ComfyUI_essentials/fonts/ShareTechMono-Regular.ttf",
-            ),
-            # System fonts
-            "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
-            "/System/Library/Fonts/Courier.dfont",
-            "C:\\Windows\\Fonts\\cour.ttf",
-        ]
-
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-
-        # Return a default that PIL will handle
-        return "arial.ttf"
+        return _find_font_path()
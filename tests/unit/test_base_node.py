@@ -63,6 +63,28 @@ class TestComfyAssetsBaseNode:
                 in mock_logger.info.call_args[0][0]
             )
 
+    def test_log_info_lazy_defers_formatting(self):
+        """Test lazy info logging passes format args through to the logger"""
+        node = ComfyAssetsBaseNode()
+
+        with patch("kikotools.base.base_node.logger") as mock_logger:
+            node.log_info_lazy("Value is %s", 42)
+
+            mock_logger.info.assert_called_once_with(
+                "%s: Value is %s", "ComfyAssetsBaseNode", 42
+            )
+
+    def test_log_enabled_info_follows_logger_level(self):
+        """Test INFO guard reflects the module logger configuration"""
+        node = ComfyAssetsBaseNode()
+
+        with patch("kikotools.base.base_node.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            assert node._log_enabled_info() is False
+
+            mock_logger.isEnabledFor.return_value = True
+            assert node._log_enabled_info() is True
+
     def test_get_node_info_returns_metadata(self):
         """Test get_node_info returns correct metadata"""
         info = ComfyAssetsBaseNode.get_node_info()
@@ -47,6 +47,14 @@ class TestBatchListConverterLogic:
             assert img.ndim == 4
             assert img.shape[0] == 1
 
+    def test_split_image_batch_views_and_empty(self):
+        """Split images share storage with the batch; empty batch gives []."""
+        images = torch.rand(3, 8, 8, 3)
+        result = split_image_batch(images)
+        for i, img in enumerate(result):
+            assert img.data_ptr() == images[i : i + 1].data_ptr()
+        assert split_image_batch(torch.rand(0, 8, 8, 3)) == []
+
     # -- Image join --
 
     def test_join_image_batch_single(self):
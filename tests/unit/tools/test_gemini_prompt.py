@@ -3,6 +3,7 @@
 import pytest
 import sys
 import numpy as np
+import torch
 from unittest.mock import patch, MagicMock
 from PIL import Image
 
@@ -74,6 +75,19 @@ class TestGeminiPromptNode:
         assert result == ("A beautiful landscape with mountains", "")
         mock_analyze.assert_called_once()
 
+    @patch("kikotools.tools.gemini_prompt.node.analyze_image_with_gemini")
+    def test_generate_prompt_tensor_batch_first_frame(self, mock_analyze):
+        """Test only the first frame of a tensor batch is converted."""
+        node = GeminiPromptNode()
+        test_image = torch.rand(4, 64, 64, 3)
+        mock_analyze.return_value = ("A cat", None)
+
+        node.generate_prompt(test_image, "flux", "gemini-2.5-flash")
+
+        image_np = mock_analyze.call_args[0][0]
+        assert image_np.shape == (1, 64, 64, 3)
+        assert np.array_equal(image_np[0], test_image[0].numpy())
+
     @patch("kikotools.tools.gemini_prompt.node.analyze_image_with_gemini")
     def test_generate_prompt_sdxl_format(self, mock_analyze):
         """Test SDXL format with positive and negative prompts."""
@@ -13,6 +13,7 @@ from unittest.mock import patch
 from kikotools.tools.kiko_save_image.node import KikoSaveImageNode
 from kikotools.tools.kiko_save_image.logic import (
     convert_tensor_to_pil,
+    convert_tensor_to_uint8,
     process_image_batch,
     validate_save_inputs,
     save_image_with_format,
@@ -49,6 +50,18 @@ class TestKikoSaveImageLogic:
         assert pil_image.size == (32, 32)
         assert pil_image.mode == "RGBA"
 
+    def test_convert_tensor_to_uint8_batch(self):
+        """Test batch conversion matches per-image conversion"""
+        images = torch.rand(3, 16, 16, 3) * 1.2 - 0.1
+
+        batch = convert_tensor_to_uint8(images)
+
+        assert batch.shape == (3, 16, 16, 3)
+        assert batch.dtype.name == "uint8"
+        for image, array in zip(images, batch):
+            assert (array == convert_tensor_to_uint8(image)).all()
+            assert convert_tensor_to_pil(image).tobytes() == array.tobytes()
+
     def test_get_next_counter_creates_file(self):
         """Test counter file creation"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -276,6 +276,31 @@ class TestLocalImageLoaderNode:
         assert audio_path == "/path/to/audio.mp3"
         assert info == ""
 
+    @patch("kikotools.tools.local_image_loader.node.create_empty_tensor")
+    @patch("kikotools.tools.local_image_loader.node.load_selections")
+    @patch("kikotools.tools.local_image_loader.node.load_image_from_path")
+    def test_load_media_placeholder_only_when_empty(
+        self, mock_load_image, mock_load_selections, mock_empty
+    ):
+        """Test the empty placeholder is only built when no image loads."""
+        mock_load_selections.return_value = {
+            "test_id": {"image": {"path": "/path/to/image.jpg"}}
+        }
+        test_tensor = torch.ones(1, 8, 8, 3)
+        mock_load_image.return_value = (test_tensor, {"width": 8})
+
+        node = LocalImageLoaderNode()
+        with patch("os.path.exists", return_value=True):
+            image, _ = node.load_media("test_id")
+        assert image is test_tensor
+        mock_empty.assert_not_called()
+
+        mock_load_image.side_effect = OSError("unreadable")
+        with patch("os.path.exists", return_value=True):
+            image, info = node.load_media("test_id")
+        assert image is mock_empty.return_value
+        assert info == ""
+
     def test_is_changed(self):
         """Test IS_CHANGED method."""
         with patch("os.path.exists", return_value=False):
@@ -250,6 +250,18 @@ class TestResolutionCalculatorNode:
         with pytest.raises(ValueError):
             node.calculate_resolution(scale_factor=2.0)
 
+    @pytest.mark.parametrize("scale_factor", ["2", True, float("nan"), float("inf")])
+    def test_calculate_resolution_rejects_invalid_scale_factor(
+        self, mock_image_tensor_square, scale_factor
+    ):
+        """Test strings, bools and non-finite scale factors are rejected"""
+        node = ResolutionCalculatorNode()
+
+        with pytest.raises(ValueError, match="scale_factor"):
+            node.calculate_resolution(
+                scale_factor=scale_factor, image=mock_image_tensor_square
+            )
+
     def test_calculate_resolution_with_various_scale_factors(
         self, mock_image_tensor_square, sample_scale_factors
     ):
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import patch
 from kikotools.tools.sampler_combo.node import SamplerComboNode
+from kikotools.tools.sampler_combo.compact_node import SamplerComboCompactNode
 from kikotools.tools.sampler_combo.logic import (
     validate_sampler_settings,
     get_sampler_combo,
@@ -78,7 +79,7 @@ class TestSamplerComboLogic:
     def test_get_compatible_scheduler_suggestions(self):
         """Test getting scheduler suggestions for different samplers."""
         suggestions = get_compatible_scheduler_suggestions("euler")
-        assert isinstance(suggestions, list)
+        assert isinstance(suggestions, tuple)
         assert len(suggestions) > 0
         assert "normal" in suggestions
 
@@ -154,14 +155,14 @@ class TestSamplerComboNode:
 
         # Check sampler input structure
         sampler_input = required["sampler_name"]
-        assert sampler_input[0] == SAMPLERS
+        assert sampler_input[0] == list(SAMPLERS)
         assert isinstance(sampler_input[1], dict)
         assert "default" in sampler_input[1]
         assert "tooltip" in sampler_input[1]
 
         # Check scheduler input structure
         scheduler_input = required["scheduler"]
-        assert scheduler_input[0] == SCHEDULERS
+        assert scheduler_input[0] == list(SCHEDULERS)
         assert isinstance(scheduler_input[1], dict)
 
         # Check steps input structure
@@ -176,9 +177,23 @@ class TestSamplerComboNode:
         assert cfg_input[1]["min"] == 0.0
         assert cfg_input[1]["max"] == 20.0
 
+    def test_input_types_include_late_samplers(self):
+        """Test INPUT_TYPES reads samplers registered after import."""
+        samplers = list(SAMPLERS) + ["custom_sampler"]
+        with patch("kikotools.tools.sampler_combo.node.SAMPLERS", samplers):
+            required = SamplerComboNode.INPUT_TYPES()["required"]
+            assert "custom_sampler" in required["sampler_name"][0]
+        with patch("kikotools.tools.sampler_combo.compact_node.SAMPLERS", samplers):
+            required = SamplerComboCompactNode.INPUT_TYPES()["required"]
+            assert "custom_sampler" in required["sampler"][0]
+            assert required["sched"][0] == list(SCHEDULERS)
+
     def test_return_types_structure(self):
         """Test that return types are correctly defined."""
         assert SamplerComboNode.RETURN_TYPES == (SAMPLERS, SCHEDULERS, "INT", "FLOAT")
+        # The live sampler lists are shared, not copied at import
+        assert SamplerComboNode.RETURN_TYPES[0] is SAMPLERS
+        assert SamplerComboCompactNode.RETURN_TYPES[1] is SCHEDULERS
         assert SamplerComboNode.RETURN_NAMES == (
             "sampler_name",
             "scheduler",
@@ -227,7 +242,7 @@ class TestSamplerComboNode:
     def test_get_scheduler_suggestions(self):
         """Test getting scheduler suggestions."""
         suggestions = self.node.get_scheduler_suggestions("euler")
-        assert isinstance(suggestions, list)
+        assert isinstance(suggestions, tuple)
         assert len(suggestions) > 0
 
         suggestions = self.node.get_scheduler_suggestions("ddim")
@@ -265,17 +280,26 @@ class TestSamplerComboNode:
         assert "steps_optimal" in analysis
         assert "cfg_optimal" in analysis
 
+    def test_get_combo_analysis_invalid_keeps_recommendations(self):
+        """Test out-of-range settings still get sampler recommendations."""
+        analysis = self.node.get_combo_analysis("euler", "normal", 2000, 7.0)
+        assert analysis["valid"] is False
+        assert analysis["scheduler_compatible"] is True
+        assert analysis["steps_optimal"] is False
+        assert isinstance(analysis["steps_rec"], dict)
+        assert isinstance(analysis["cfg_rec"], dict)
+
     def test_get_available_samplers(self):
         """Test getting available samplers."""
         samplers = SamplerComboNode.get_available_samplers()
-        assert isinstance(samplers, list)
+        assert isinstance(samplers, tuple)
         assert len(samplers) > 0
         assert "euler" in samplers
 
     def test_get_available_schedulers(self):
         """Test getting available schedulers."""
         schedulers = SamplerComboNode.get_available_schedulers()
-        assert isinstance(schedulers, list)
+        assert isinstance(schedulers, tuple)
         assert len(schedulers) > 0
         assert "normal" in schedulers
 
@@ -1,6 +1,9 @@
 """Tests for Seed History tool."""
 
 import time
+from unittest.mock import patch
+
+import pytest
 
 from kikotools.tools.seed_history.node import SeedHistoryNode
 from kikotools.tools.seed_history.logic import (
@@ -8,6 +11,7 @@ from kikotools.tools.seed_history.logic import (
     validate_seed_value,
     sanitize_seed_value,
     create_history_entry,
+    format_entry_date,
     filter_duplicate_seeds,
     add_seed_to_history,
     format_time_ago,
@@ -15,6 +19,7 @@ from kikotools.tools.seed_history.logic import (
     get_history_statistics,
     export_history_to_text,
     import_seeds_from_list,
+    _import_seeds_slow,
 )
 
 
@@ -214,13 +219,18 @@ class TestSeedHistoryLogic:
         entry = create_history_entry(seed, timestamp)
         assert entry["seed"] == seed
         assert entry["timestamp"] == timestamp
-        assert "dateString" in entry
+        assert "dateString" not in entry  # Formatted lazily on export
 
         # With auto timestamp
         entry_auto = create_history_entry(seed)
         assert entry_auto["seed"] == seed
         assert "timestamp" in entry_auto
-        assert "dateString" in entry_auto
+
+    def test_format_entry_date(self):
+        """Test lazy date formatting for history entries."""
+        timestamp = time.time()
+        expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+        assert format_entry_date(timestamp) == expected
 
     def test_filter_duplicate_seeds(self):
         """Test duplicate seed filtering."""
@@ -276,6 +286,35 @@ class TestSeedHistoryLogic:
 
         assert len(history_long) == 10
 
+    def test_add_seed_to_history_returns_new_list(self):
+        """Test history is returned as a new, bounded list."""
+        history, _ = add_seed_to_history([], 1, max_history=3)
+        for seed in (2, 3, 4):
+            updated, was_added = add_seed_to_history(history, seed, max_history=3)
+            assert was_added
+            assert updated is not history
+            history = updated
+
+        assert isinstance(history, list)
+        assert [entry["seed"] for entry in history] == [4, 3, 2]
+
+        # Duplicate within the window leaves the history untouched
+        same, was_added = add_seed_to_history(history, 4, max_history=3)
+        assert not was_added
+        assert same is history
+
+    def test_add_seed_to_history_trims_long_history(self):
+        """Test a long input history is cut to max_history around the new seed."""
+        now = time.time()
+        history = [create_history_entry(seed, now - 60 - seed) for seed in range(20)]
+
+        new_history, was_added = add_seed_to_history(history, 1, max_history=4)
+        assert was_added
+        assert [entry["seed"] for entry in new_history] == [1, 0, 2, 3]
+        assert len(history) == 20  # Original left untouched
+
+        assert add_seed_to_history(history, 99, max_history=0) == ([], True)
+
     def test_format_time_ago(self):
         """Test time ago formatting."""
         now = time.time()
@@ -336,6 +375,7 @@ class TestSeedHistoryLogic:
         assert "12345" in text
         assert "54321" in text
         assert "Total seeds: 2" in text
+        assert " 1. 12345 (0s ago)" in text.splitlines()
 
     def test_import_seeds_from_list(self):
         """Test importing seeds from list."""
@@ -353,6 +393,33 @@ class TestSeedHistoryLogic:
         assert history[0]["timestamp"] > history[1]["timestamp"]
         assert history[1]["timestamp"] > history[2]["timestamp"]
 
+    @pytest.mark.parametrize(
+        "seed_list, vectorized",
+        [
+            ([1, "2", 3], False),  # Mixed int/str
+            ([-1, 5, 0xFFFFFFFF + 1, 0, 0xFFFFFFFF], True),  # Out of range
+            ([7, 7, 3, 7], True),  # Duplicates
+            ([], True),  # Empty list
+        ],
+    )
+    def test_import_seeds_numpy_matches_slow_path(self, seed_list, vectorized):
+        """Test the NumPy import path gives the same entries as the slow path."""
+        logic = "kikotools.tools.seed_history.logic"
+        with patch(f"{logic}.time.time", return_value=1_700_000_000.0):
+            with patch(f"{logic}.NUMPY_AVAILABLE", False):
+                expected = import_seeds_from_list(seed_list)
+
+            with patch(
+                f"{logic}._import_seeds_slow", wraps=_import_seeds_slow
+            ) as slow:
+                history = import_seeds_from_list(seed_list)
+
+        assert slow.called is not vectorized
+        assert history == expected
+        if vectorized:
+            # NumPy scalars are converted back to plain ints
+            assert all(type(entry["seed"]) is int for entry in history)
+
 
 class TestSeedHistoryIntegration:
     """Test integration scenarios."""
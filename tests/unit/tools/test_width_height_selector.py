@@ -1,19 +1,30 @@
 """Tests for Width Height Selector tool."""
 
+import pytest
+
 from kikotools.tools.width_height_selector.node import WidthHeightSelectorNode
 from kikotools.tools.width_height_selector.logic import (
     get_preset_dimensions,
     calculate_aspect_ratio,
     validate_dimensions,
+    sanitize_dimensions,
+    get_dimension_info,
 )
 from kikotools.tools.width_height_selector.presets import (
     PRESET_OPTIONS,
     PRESET_METADATA,
+    PRESET_CATEGORIES,
+    FORMATTED_PRESET_OPTIONS,
     SDXL_PRESETS,
     FLUX_PRESETS,
     ULTRA_WIDE_PRESETS,
+    calculate_aspect_ratio as calculate_preset_aspect_ratio,
     get_preset_metadata,
     get_presets_by_model_group,
+    get_presets_by_aspect_ratio,
+    get_presets_by_category,
+    get_preset_category,
+    get_model_recommendation,
 )
 
 
@@ -114,6 +125,26 @@ class TestWidthHeightSelectorNode:
         )
         assert result == (2560, 1080)
 
+    def test_extract_preset_name(self):
+        """Test dropdown labels, raw names and stale labels map to presets."""
+        for option in self.node.INPUT_TYPES()["required"]["preset"][0]:
+            assert self.node._extract_preset_name(option) in PRESET_OPTIONS
+
+        assert self.node._extract_preset_name("1024×1024") == "1024×1024"
+        # Label saved before the metadata changed
+        assert self.node._extract_preset_name("1024×1024 - 1:1 (9.9MP) - Old") == (
+            "1024×1024"
+        )
+        assert self.node._extract_preset_name("bogus - 1:1") == "custom"
+
+    def test_input_types_cached(self):
+        """Test INPUT_TYPES is built once and reused."""
+        assert WidthHeightSelectorNode.INPUT_TYPES() is self.node.INPUT_TYPES()
+        preset_options = self.node.INPUT_TYPES()["required"]["preset"][0]
+        assert preset_options is FORMATTED_PRESET_OPTIONS
+        assert preset_options[0] == "custom"
+        assert len(preset_options) == len(PRESET_OPTIONS)
+
     def test_all_presets_available(self):
         """Test that all presets are available in INPUT_TYPES."""
         input_types = self.node.INPUT_TYPES()
@@ -176,6 +207,23 @@ class TestPresetLogic:
         assert width == 800
         assert height == 600
 
+    def test_get_preset_dimensions_cache_keeps_types(self):
+        """Test a float call does not change the result of a later int call."""
+        assert get_preset_dimensions("custom", 1000.0, 600.0) == (1000.0, 600.0)
+        width, height = get_preset_dimensions("custom", 1000, 600)
+        assert type(width) is int and type(height) is int
+
+    def test_get_dimension_info_returns_fresh_dict(self):
+        """Test callers get their own mutable, JSON-friendly dict."""
+        info = get_dimension_info("1024×1024", 512, 512, False)
+        assert type(info) is dict
+        assert info["width"] == 1024
+        info["width"] = 0
+
+        again = get_dimension_info("1024×1024", 512, 512, False)
+        assert again is not info
+        assert again["width"] == 1024
+
 
 class TestDimensionValidation:
     """Test dimension validation."""
@@ -193,6 +241,11 @@ class TestDimensionValidation:
         assert validate_dimensions(1024, 1025) is False  # Height not divisible by 8
         assert validate_dimensions(1025, 1025) is False  # Neither divisible by 8
 
+    def test_sanitized_dimensions_always_valid(self):
+        """Test sanitize_dimensions output always passes validation."""
+        for value in (-100, 0, 1, 63, 65, 1023, 1025, 8188, 8190, 9000):
+            assert validate_dimensions(*sanitize_dimensions(value, value)) is True
+
     def test_validate_dimensions_minimum_size(self):
         """Test minimum dimension requirements."""
         assert validate_dimensions(64, 64) is True  # Minimum allowed
@@ -281,10 +334,67 @@ class TestPresetDefinitions:
                     64 <= height <= 8192
                 ), f"{preset_name} height {height} out of range"
 
+    def test_preset_tables_read_only(self):
+        """Test that shared preset tables cannot be mutated."""
+        with pytest.raises(TypeError):
+            PRESET_OPTIONS["custom"] = (512, 512)
+        with pytest.raises(TypeError):
+            SDXL_PRESETS["64×64"] = (64, 64)
+        assert isinstance(PRESET_CATEGORIES["Custom"], tuple)
+
+    def test_legacy_tables_built_on_access(self):
+        """Test legacy preset tables are created lazily and then reused."""
+        from kikotools.tools.width_height_selector import presets
+
+        assert presets.QWEN_PRESETS is presets.QWEN_PRESETS
+        assert presets.QWEN_PRESETS["1328×1328"] == (1328, 1328)
+        assert presets.PRESET_DESCRIPTIONS["1024×1024"] == (
+            PRESET_METADATA["1024×1024"].description
+        )
+        with pytest.raises(AttributeError):
+            presets.NOT_A_TABLE
+
+    def test_preset_categories_cover_all_presets(self):
+        """Test every preset is listed under its model group and category."""
+        listed = [p for presets in PRESET_CATEGORIES.values() for p in presets]
+        assert sorted(listed) == sorted(PRESET_OPTIONS)
+        for preset_name, metadata in PRESET_METADATA.items():
+            key = f"{metadata.model_group} {metadata.category}"
+            assert preset_name in PRESET_CATEGORIES[key]
+
+    def test_preset_categories_order(self):
+        """Test categories keep their hand-ordered display layout."""
+        assert list(PRESET_CATEGORIES) == [
+            "Custom",
+            "SDXL Square",
+            "SDXL Portrait",
+            "SDXL Landscape",
+            "FLUX Square",
+            "FLUX Portrait",
+            "FLUX Cinematic",
+            "FLUX Classic",
+            "FLUX Photography",
+            "Ultra-Wide Gaming",
+            "Ultra-Wide Cinematic",
+            "Ultra-Wide Panoramic",
+            "Ultra-Wide Mobile",
+            "Ultra-Wide Vertical",
+            "Ultra-Wide Banner",
+            "Qwen Square",
+            "Qwen Portrait",
+            "Qwen Landscape",
+        ]
+
 
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
+    def test_get_dimensions_invalid_input_raises(self):
+        """Test bad input values surface as ValueError from get_dimensions."""
+        node = WidthHeightSelectorNode()
+        with pytest.raises(ValueError):
+            node.get_dimensions(preset="custom", width="wide", height=1024)
+
     def test_zero_dimensions(self):
         """Test handling of zero dimensions."""
         assert validate_dimensions(0, 1024) is False
@@ -347,6 +457,12 @@ class TestPresetMetadata:
                 assert metadata.aspect_ratio == "16:9"
                 assert abs(metadata.aspect_decimal - 1.778) < 0.01
 
+    def test_preset_aspect_ratio_reduced(self):
+        """Test the preset helper reduces ratios to lowest terms."""
+        assert calculate_preset_aspect_ratio(1920, 1080) == ("16:9", 1920 / 1080)
+        assert calculate_preset_aspect_ratio(896, 1152) == ("7:9", 896 / 1152)
+        assert calculate_preset_aspect_ratio(1024, 1024) == ("1:1", 1.0)
+
     def test_metadata_megapixels(self):
         """Test that megapixel calculations are correct."""
         for preset_name, metadata in PRESET_METADATA.items():
@@ -382,6 +498,34 @@ class TestPresetMetadata:
         assert metadata.height == 0
         assert metadata.model_group == "Custom"
 
+    def test_get_presets_by_aspect_ratio_and_category(self):
+        """Test aspect ratio and category queries return matching presets."""
+        square = get_presets_by_aspect_ratio("1:1")
+        assert "1024×1024" in square
+        assert all(m.aspect_ratio == "1:1" for m in square.values())
+
+        cinematic = get_presets_by_category("Cinematic")
+        assert "1920×1080" in cinematic
+        assert all(m.category == "Cinematic" for m in cinematic.values())
+
+        assert get_presets_by_aspect_ratio("99:1") == {}
+        assert get_presets_by_category("Unknown") == {}
+
+        # Callers get their own copy
+        square.clear()
+        assert get_presets_by_aspect_ratio("1:1")
+
+    def test_preset_category_and_model_lookup(self):
+        """Test category and model recommendation reverse lookups."""
+        assert get_preset_category("1024×1024") == "Square"
+        assert get_preset_category("1920×1080") == "Cinematic"
+        assert get_preset_category("custom") == "Custom"
+        assert get_preset_category("not-a-preset") == "Unknown"
+
+        assert get_model_recommendation("1024×1024") == "Optimized for SDXL"
+        assert get_model_recommendation("1328×1328") == "Optimized for Qwen"
+        assert get_model_recommendation("custom") == "Custom dimensions"
+
 
 class TestNodeMetadataIntegration:
     """Test node integration with metadata."""
@@ -397,6 +541,9 @@ class TestNodeMetadataIntegration:
         assert "1.0MP" in info or "1.1MP" in info  # Megapixels
         assert "SDXL" in info  # Description
 
+        assert self.node.get_preset_info("custom").startswith("Custom dimensions")
+        assert self.node.get_preset_info("bogus") == "Unknown preset: bogus"
+
     def test_get_presets_by_model_static(self):
         """Test static method for getting presets by model."""
         sdxl_presets = self.node.get_presets_by_model("SDXL")
@@ -415,6 +562,20 @@ class TestNodeMetadataIntegration:
         assert metadata_dict["height"] == 1080
         assert metadata_dict["aspect_ratio"] == "16:9"
         assert metadata_dict["model_group"] == "FLUX"
+        assert list(metadata_dict) == [
+            "width",
+            "height",
+            "aspect_ratio",
+            "aspect_decimal",
+            "megapixels",
+            "model_group",
+            "category",
+            "description",
+        ]
+
+        # Callers get their own copy
+        metadata_dict["width"] = 0
+        assert self.node.get_preset_metadata_static("1920×1080")["width"] == 1920
 
     def test_get_model_groups(self):
         """Test static method for getting model groups."""
@@ -422,6 +583,7 @@ class TestNodeMetadataIntegration:
         assert "SDXL" in groups
         assert "FLUX" in groups
         assert "Ultra-Wide" in groups
+        assert len(groups) == len(set(groups))
 
 
 class TestMetadataValidation:
@@ -443,6 +605,21 @@ class TestMetadataValidation:
 
         assert validate_metadata_consistency() is True
 
+    @pytest.mark.parametrize(
+        "value, enabled",
+        [("1", True), ("true", True), ("YES", True), ("0", False), ("", False)],
+    )
+    def test_import_time_validation_flag(self, monkeypatch, value, enabled):
+        """Test the validation flag is parsed and presets still load."""
+        import runpy
+
+        from kikotools.tools.width_height_selector import presets
+
+        monkeypatch.setenv("KIKO_VALIDATE_PRESETS", value)
+        namespace = runpy.run_path(presets.__file__)
+        assert namespace["_VALIDATE_ON_IMPORT"] is enabled
+        assert namespace["PRESET_OPTIONS"] == presets.PRESET_OPTIONS
+
 
 class TestFormattedPresets:
     """Test formatted preset functionality."""
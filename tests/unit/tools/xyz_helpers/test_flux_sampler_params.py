@@ -6,6 +6,7 @@ from unittest.mock import Mock, MagicMock, patch
 from kikotools.tools.xyz_helpers.flux_sampler_params import FluxSamplerParamsNode
 from kikotools.tools.xyz_helpers.flux_sampler_params.logic import (
     parse_string_to_list,
+    parse_string_to_int_list,
     parse_seed_string,
     parse_sampler_string,
     parse_scheduler_string,
@@ -13,6 +14,7 @@ from kikotools.tools.xyz_helpers.flux_sampler_params.logic import (
     create_batch_params,
     process_conditioning_input,
     validate_flux_params,
+    _parse_float_values,
 )
 
 
@@ -26,6 +28,23 @@ class TestFluxSamplerParamsLogic:
         assert parse_string_to_list("") == []
         assert parse_string_to_list("1.0, invalid, 3.0") == [1.0, 3.0]
 
+    def test_parse_string_to_list_cached_copy(self):
+        """Test repeated parses share the cache but return independent lists."""
+        _parse_float_values.cache_clear()
+        first = parse_string_to_list("0.5, 1.0")
+        first.append(9.0)
+        second = parse_string_to_list("0.5, 1.0")
+
+        assert second == [0.5, 1.0]
+        assert second is not first
+        assert _parse_float_values.cache_info().hits == 1
+
+    def test_parse_string_to_int_list(self):
+        """Test parsing comma-separated strings to int lists."""
+        assert parse_string_to_int_list("20, 30.0, 25.7") == [20, 30, 25]
+        assert parse_string_to_int_list("") == []
+        assert parse_string_to_int_list("10, invalid") == [10]
+
     def test_parse_seed_string(self):
         """Test parsing seed strings."""
         seeds = parse_seed_string("123, 456, 789")
@@ -60,6 +79,10 @@ class TestFluxSamplerParamsLogic:
         assert "dpmpp_2m" in result
         assert "uni_pc" in result
 
+        # Test mixed separators, padding and unknown names
+        result = parse_sampler_string(" euler \r\n dpmpp_2m ,bogus,", available)
+        assert result == ["euler", "dpmpp_2m"]
+
     def test_parse_scheduler_string(self):
         """Test parsing scheduler strings."""
         available = ["normal", "karras", "simple", "exponential"]
@@ -8,6 +8,7 @@ from kikotools.tools.xyz_helpers.lora_folder_batch import LoRAFolderBatchNode
 from kikotools.tools.xyz_helpers.lora_folder_batch.logic import (
     scan_folder_for_loras,
     natural_sort,
+    sort_lora_files,
     filter_loras_by_pattern,
     parse_strength_string,
     create_lora_params,
@@ -57,6 +58,17 @@ class TestLoRAFolderBatchLogic:
             "subdir1/model-20.safetensors"
         )
 
+    def test_sort_lora_files_orders(self):
+        """Test each sort order and the unknown-order passthrough."""
+        files = ["b10.safetensors", "a2.safetensors", "b2.safetensors"]
+        natural = ["a2.safetensors", "b2.safetensors", "b10.safetensors"]
+
+        assert sort_lora_files(files, "natural") == natural
+        assert sort_lora_files(files, "oldest") == natural
+        assert sort_lora_files(files, "newest") == natural[::-1]
+        assert sort_lora_files(files, "alphabetical") == sorted(files)
+        assert sort_lora_files(files, "unknown") is files
+
     def test_filter_loras_by_pattern(self):
         """Test filtering LoRAs by patterns."""
         files = [
@@ -97,6 +109,16 @@ class TestLoRAFolderBatchLogic:
         strengths = parse_strength_string("0.8...1.0")
         assert len(strengths) == 3  # 0.8, 0.9, 1.0
 
+    def test_parse_strength_string_range_edges(self):
+        """Test long, reversed and non-positive-step ranges."""
+        strengths = parse_strength_string("0.0...2.0+0.1")
+        assert len(strengths) == 21
+        assert strengths[-1] == 2.0
+
+        assert parse_strength_string("1.0...0.5+0.1") == []
+        assert parse_strength_string("0.5...1.0+0") == [1.0]
+        assert parse_strength_string("0.5...1.0+-0.1") == [1.0]
+
     def test_parse_strength_string_empty(self):
         """Test parsing empty strength string."""
         strengths = parse_strength_string("")
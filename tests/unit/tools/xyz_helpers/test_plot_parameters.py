@@ -3,7 +3,12 @@
 import pytest
 import torch
 from unittest.mock import Mock, patch
+from PIL import ImageDraw
 from kikotools.tools.xyz_helpers.plot_sampler_params import PlotParametersNode
+from kikotools.tools.xyz_helpers.plot_sampler_params.node import (
+    _font_metrics,
+    _load_font,
+)
 from kikotools.tools.xyz_helpers.plot_sampler_params.logic import (
     sort_parameters,
     group_by_value,
@@ -225,6 +230,79 @@ class TestPlotParametersNode:
             assert len(result) == 1
             assert isinstance(result[0], torch.Tensor)
 
+        # Do not leave the mocked font in the caches
+        _load_font.cache_clear()
+        _font_metrics.cache_clear()
+
+    def test_plot_parameters_cleans_nan(self, node, mock_images, mock_params):
+        """Test NaN pixels are zeroed and values clamped in the output."""
+        mock_images[0, 0, 0, 0] = float("nan")
+        mock_images[1, 0, 0, 0] = 2.0
+
+        (result,) = node.plot_parameters(
+            mock_images,
+            mock_params,
+            order_by="none",
+            cols_value="none",
+            cols_num=-1,
+            add_prompt="false",
+            add_params="false",
+        )
+
+        assert not torch.isnan(result).any()
+        assert result.max() <= 1.0
+        assert result[0, 0, 0, 0] == 0.0
+
+    def test_shared_prompt_drawn_once(self, node, mock_images, mock_params):
+        """Test identical annotation strips are rendered once per batch."""
+        for param in mock_params:
+            param["prompt"] = "a cat sitting on a mat"
+
+        with patch(
+            "kikotools.tools.xyz_helpers.plot_sampler_params.node.ImageDraw.Draw",
+            wraps=ImageDraw.Draw,
+        ) as draw:
+            (result,) = node.plot_parameters(
+                mock_images,
+                mock_params,
+                order_by="none",
+                cols_value="none",
+                cols_num=-1,
+                add_prompt="full",
+                add_params="false",
+            )
+
+        assert draw.call_count == 1
+        assert result.shape[1] > 256
+
+    def test_font_loaded_once_per_size(self):
+        """Test fonts are cached by path and size."""
+        _load_font.cache_clear()
+        try:
+            with patch(
+                "kikotools.tools.xyz_helpers.plot_sampler_params.node.ImageFont.truetype"
+            ) as truetype:
+                first = _load_font("font.ttf", 12)
+                assert _load_font("font.ttf", 12) is first
+                _load_font("font.ttf", 24)
+
+            assert truetype.call_count == 2
+        finally:
+            _load_font.cache_clear()
+
+    def test_font_metrics_cached(self):
+        """Test font metrics are measured once per font and stay positive."""
+        _font_metrics.cache_clear()
+        try:
+            line_height, char_width = _font_metrics("missing-font.ttf", 16)
+            assert line_height > 0
+            assert char_width > 0
+            assert _font_metrics("missing-font.ttf", 16) == (line_height, char_width)
+            assert _font_metrics.cache_info().hits == 1
+        finally:
+            _font_metrics.cache_clear()
+            _load_font.cache_clear()
+
     def test_node_properties(self):
         """Test node properties."""
         assert PlotParametersNode.CATEGORY == "🫶 ComfyAssets/🧰 xyz-helpers"